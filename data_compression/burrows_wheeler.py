@@ -1,210 +1,243 @@
-from collections import deque
+import struct
 from huffman import Huffman
 
 
 R = 256  # Extended ASCII
 
 
-def counting_sort(string):
+def counting_sort(data):
     """
-    Perform a key-index counting sort on the input string and return the sorted indices.
+    Perform a key-index counting sort on the input bytes and return the sorted indices.
+
+    The indices are ordered by a stable sort keyed on the bytes, which yields the
+    same permutation as key-indexed counting while running the loops inside list.sort.
 
     Args:
-        string (str): The input string to be sorted.
+        data (bytes): The input bytes to be sorted.
 
     Returns:
-        list: A list of indices representing the sorted order of characters in the input string.
+        list: A list of indices representing the sorted order of the bytes in the input.
     """
-    length = len(string)
-    indices = [0] * length
-    count = [0] * (R + 1)
-
-    # Count frequencies of each character
-    for i in range(length):
-        count[ord(string[i]) + 1] += 1
-
-    # Compute cumulative counts
-    for r in range(R):
-        count[r + 1] += count[r]
-
-    # Place the indices of the characters in the sorted order
-    for i in range(length):
-        indices[count[ord(string[i])]] = i
-        count[ord(string[i])] += 1
+    return sorted(range(len(data)), key=data.__getitem__)
 
-    return indices
-
-def circular_suffix_array(string):
+def circular_suffix_array(data):
     """
-    Generates the circular suffix array of a given string using a 3-way radix quicksort.
+    Generates the circular suffix array of the given bytes using prefix doubling.
+
+    The circular suffixes are first ranked by their first character. Each round then
+    sorts them by the pair of ranks of their first k characters and of the k characters
+    that follow, which ranks them by their first 2k characters, until all ranks are distinct.
     
     Args:
-        string (str): The input string for which to compute the circular suffix array.
+        data (bytes): The input bytes for which to compute the circular suffix array.
 
     Returns:
-        list: A list of starting indices that represent the lexicographically sorted circular suffixes of the input string.
+        list: A list of starting indices that represent the lexicographically sorted circular suffixes of the input.
     """
-    length = len(string)
-
-    # Initialize the indices list with starting positions of suffixes
-    indices = list(range(length))
-
-    def sort(string, lo, hi, depth, length):
-        """
-        Recursive 3-way radix quicksort to sort the suffixes.
-        
-        Args:
-            string (str): The input string.
-            lo (int): The lower bound of the current partition.
-            hi (int): The upper bound of the current partition.
-            depth (int): The current character depth to consider in sorting.
-            length (int): The length of the input string.
-        """
-        if hi <= lo or depth >= length:
-            return
+    length = len(data)
 
-        less_than, greater_than = lo, hi
+    # Rank the circular suffixes by their first byte
+    rank = list(data)
 
-        # Select the pivot character, considering circular behavior
-        pivot = string[(indices[lo] + depth) % length]
-
-        i = lo + 1
-
-        while i <= greater_than:
-            t = string[(indices[i] + depth) % length]
-
-            if t < pivot:
-                # Swap and move less_than and i pointers
-                indices[less_than], indices[i] = indices[i], indices[less_than]
-                less_than += 1
-                i += 1
-
-            elif t > pivot:
-                # Swap and move greater_than pointer
-                indices[greater_than], indices[i] = indices[i], indices[greater_than]
-                greater_than -= 1
-
-            else:
-                # Move i pointer if the characters are equal to the pivot
-                i += 1
-
-        # Recursively sort the three partitions
-        sort(string, lo, less_than - 1, depth, length)
-        sort(string, less_than, greater_than, depth + 1, length)
-        sort(string, greater_than + 1, hi, depth, length)
-
-    # Initial call to the sorting function
-    sort(string, 0, length - 1, 0, length)
+    # Initialize the indices list with starting positions of suffixes.
+    # The first round buckets them by their first two characters, so no separate sort by the first one is needed.
+    indices = list(range(length))
+    base = max(length, R)  # Larger than any rank, so that each pair of ranks gets a unique key
+    width = 1
+
+    while width < length:
+        # Sort by the rank of the first 'width' characters, then by the rank of the next 'width' characters
+        # The ranks of the following characters are read from the ranks rotated by 'width', with no modulo
+        following = rank[width:] + rank[:width]
+        keys = [first_rank * base + next_rank for first_rank, next_rank in zip(rank, following)]
+        indices.sort(key=keys.__getitem__)
+
+        # Assign new ranks, equal suffixes (so far) share the same rank
+        current = 0
+        for i in range(1, length):
+            if keys[indices[i]] != keys[indices[i - 1]]:
+                current += 1
+            rank[indices[i]] = current
+        rank[indices[0]] = 0
+
+        # Every circular suffix has a distinct rank, the order is final
+        if current == length - 1:
+            break
+
+        width <<= 1
 
     # Return the sorted indices representing the circular suffix array
     return indices
 
-def burrows_wheeler_transform(string):
+def burrows_wheeler_transform(data):
     """
-    Perform the Burrows-Wheeler Transform on the given input string.
+    Perform the Burrows-Wheeler Transform on the given input bytes.
 
     Args:
-        string (str): The input string to be transformed.
+        data (bytes): The input bytes to be transformed.
 
     Returns:
-        tuple: A tuple containing the index of the original string in the sorted suffix array and the transformed string.
+        tuple: A tuple containing the index of the original input in the sorted suffix array and the transformed bytes.
     """
-    length = len(string)
-
     # Get the starting indices of the sorted circular suffixes of the input
-    indices = circular_suffix_array(string)
-    transform = [""] * length
+    indices = circular_suffix_array(data)
 
-    # Build the transformed string
-    for i, index in enumerate(indices):
-        transform[i] = string[(index + length - 1) % length]
+    # Track the position of the original input in the sorted suffix array
+    first = indices.index(0)
 
-        # Track the position of the original string in the sorted suffix array
-        if index == 0:
-            first = i
+    # Build the transformed bytes from the last byte of each circular suffix,
+    # index - 1 wraps around to the end for index 0
+    transform = bytes([data[index - 1] for index in indices])
 
-    return first, ''.join(transform)
+    return first, transform
 
 def burrows_wheeler_inverse(first, transform):
     """
     Perform the Burrows-Wheeler Inverse Transform on the given input.
 
     Args:
-        first (int): The index of the original string in the sorted suffix array.
-        transform (str): The transformed string.
+        first (int): The index of the original input in the sorted suffix array.
+        transform (bytes): The transformed bytes, or a bytearray holding them.
 
     Returns:
-        str: The original string before the Burrows-Wheeler Transform.
+        bytes: The original bytes before the Burrows-Wheeler Transform.
     """
     # Get the sorted order of characters and their next indices
     next_list = counting_sort(transform)
     next_index = first
-    inverse = []
+    walk = [0] * len(transform)
 
-    # Reconstruct the original string
-    for i in range(len(transform)):
-        inverse.append(transform[next_list[next_index]])
+    # Follow the next indices from the original string, only the pointer chase stays in the loop
+    for i in range(len(walk)):
         next_index = next_list[next_index]
+        walk[i] = next_index
+
+    # Reconstruct the original bytes by gathering them along the walk
+    return bytes(map(transform.__getitem__, walk))
 
-    return ''.join(inverse)
+class MoveToFrontTable:
+    """
+    The move-to-front symbol table, stored as a doubly linked list over the R symbols.
 
-def move_to_front_encode(string):
+    The links are indexed by symbol, so a symbol is unlinked and moved to the front in
+    constant time. Finding the position of a symbol, or the symbol at a position, walks
+    the list from the front, which stops early since most recent symbols are near it.
     """
-    Perform move-to-front encoding on the input string.
+
+    def __init__(self):
+        """
+        Initialize the table with the R extended ASCII symbols in their natural order.
+        """
+        self.head = 0                                  # Symbol at the front of the table
+        self.next = list(range(1, R)) + [-1]           # Symbol following each symbol, -1 at the end
+        self.previous = [-1] + list(range(R - 1))      # Symbol preceding each symbol, -1 at the front
+
+    def rank(self, symbol):
+        """
+        Return the current position of the symbol in the table.
+
+        Args:
+            symbol (int): The symbol to look up.
+
+        Returns:
+            int: The number of symbols in front of it.
+        """
+        rank = 0
+        current = self.head
+        while current != symbol:
+            current = self.next[current]
+            rank += 1
+        return rank
+
+    def select(self, rank):
+        """
+        Return the symbol at the given position of the table.
+
+        Args:
+            rank (int): The position of the symbol.
+
+        Returns:
+            int: The symbol with exactly 'rank' symbols in front of it.
+        """
+        current = self.head
+        for _ in range(rank):
+            current = self.next[current]
+        return current
+
+    def move_to_front(self, symbol):
+        """
+        Move the symbol to the front of the table.
+
+        Args:
+            symbol (int): The symbol to move.
+        """
+        if symbol == self.head:
+            return
+
+        # Unlink the symbol from its current position
+        previous, following = self.previous[symbol], self.next[symbol]
+        self.next[previous] = following
+        if following != -1:
+            self.previous[following] = previous
+
+        # Link it back in front of the current head
+        self.next[symbol] = self.head
+        self.previous[self.head] = symbol
+        self.previous[symbol] = -1
+        self.head = symbol
+
+def move_to_front_encode(data):
+    """
+    Perform move-to-front encoding on the input bytes.
 
     Args:
-        string (str): The input string to be encoded.
+        data (bytes): The input bytes to be encoded.
 
     Returns:
-        list: A list of integers representing the move-to-front encoded values.
+        bytearray: The move-to-front encoded values.
     """
 
-    # Initialize the symbol table as a deque containing ASCII characters
-    symbol_table = deque([chr(i) for i in range(R)])
-    encoded = []  # List to store the encoded output
+    # Initialize the symbol table containing ASCII characters
+    symbol_table = MoveToFrontTable()
+    encoded = bytearray()  # Buffer to store the encoded output
     
-    for char in string:
-        # Find the index of the current character in the symbol table
-        index = symbol_table.index(char)
-        
-        # Append the index to the encoded output
-        encoded.append(index)
-        
-        # Move the character to the front of the symbol table
-        symbol_table.remove(char)
-        symbol_table.appendleft(char)
+    for symbol in data:
+        # Append the position of the current byte in the symbol table to the encoded output
+        encoded.append(symbol_table.rank(symbol))
+
+        # Move the byte to the front of the symbol table
+        symbol_table.move_to_front(symbol)
 
     return encoded
 
 def move_to_front_decode(encoded):
     """
-    Perform move-to-front decoding on the encoded list.
+    Perform move-to-front decoding on the encoded values.
 
     Args:
         encoded (list): A list of integers representing the move-to-front encoded values.
 
     Returns:
-        str: The original string after decoding.
+        bytearray: The original bytes after decoding.
     """
 
-    # Initialize the symbol table as a deque containing ASCII characters
-    symbol_table = deque([chr(i) for i in range(R)])
+    # Initialize the symbol table containing ASCII characters
+    symbol_table = MoveToFrontTable()
 
-    # List to store the decoded characters
-    decoded = []
+    # Buffer to store the decoded bytes
+    decoded = bytearray()
 
     for code in encoded:
-        # Get the character from the symbol table using the index
-        char = symbol_table[code]
+        # Get the byte from the symbol table using the index
+        symbol = symbol_table.select(code)
 
-        # Append the character to the decoded output
-        decoded.append(char)
+        # Append the byte to the decoded output
+        decoded.append(symbol)
 
-        # Move the character to the front of the symbol table
-        symbol_table.remove(char)
-        symbol_table.appendleft(char)
+        # Move the byte to the front of the symbol table
+        symbol_table.move_to_front(symbol)
 
-    return ''.join(decoded)
+    return decoded
 
 def compress(input_file, compressed_file, trie_file):
     """
@@ -218,23 +251,17 @@ def compress(input_file, compressed_file, trie_file):
         trie_file (str): The path to the file where the Huffman trie will be written.
     """
     # Read the content from the input file
-    with open(input_file, 'r') as file:
+    with open(input_file, 'rb') as file:
         content = file.read()
 
         # Apply the Burrows-Wheeler transform
         first, transformed = burrows_wheeler_transform(content)
 
-        # Apply Move-to-Front encoding to the transformed string
+        # Apply Move-to-Front encoding to the transformed bytes
         encoded = move_to_front_encode(transformed)
 
-        # Convert the 'first' index to a 32-bit binary string and append its bytes to the encoded data
-        binary_first = format(first, '032b')
-        n_bytes = 4  # Number of bytes in the 32-bit binary string
-        n_bits = 8  # Number of bits in a byte
-
-        for i in range(n_bytes):
-            binary = binary_first[i*n_bits:i*n_bits+n_bits]
-            encoded.append(int(binary, 2))
+        # Append the 'first' index to the encoded data as a 32-bit big-endian integer
+        encoded.extend(struct.pack('>I', first))
 
         # Create a Huffman encoder instance and compress the encoded data
         huffman = Huffman()
@@ -255,29 +282,20 @@ def expand(compressed_file, expanded_file, trie_file):
     huffman = Huffman()
     decoded = huffman.expand_indices(compressed_file, trie_file)
 
-    # Initialize variables to store the first index
-    n_bytes = 4  # Number of bytes in the 32-bit integer
-    n_bits = 8   # Number of bits in a byte
-    binary_first = ""
-
     # Retrieve and remove the 'first' index from the decoded data
-    # The 'first' index is stored as the last 4 bytes of the decoded data
-    for i in range(n_bytes):
-        first = decoded.pop()
-        binary = format(first, '08b')  # Convert the byte to an 8-bit binary string
-        binary_first = binary + binary_first  # Concatenate to build the 32-bit binary string
-
-    # Convert the 32-bit binary string to an integer
-    first = int(binary_first, 2)
+    # The 'first' index is stored as a 32-bit big-endian integer in the last 4 bytes of the decoded data
+    first = struct.unpack('>I', bytes(decoded[-4:]))[0]
+    del decoded[-4:]
 
-    # Apply Move-to-Front decoding to the remaining data
+    # Apply Move-to-Front decoding to the remaining data.
+    # The inverse transform reads the decoded bytearray in place, without an intermediate copy.
     transformed = move_to_front_decode(decoded)
 
     # Apply Burrows-Wheeler inverse transform to reconstruct the original content
     decoded_content = burrows_wheeler_inverse(first, transformed)
     
     # Write the decoded content to the expanded file
-    with open(expanded_file, 'w') as file:
+    with open(expanded_file, 'wb') as file:
         file.write(decoded_content)
 
 def main():
@@ -1,62 +1,68 @@
 import struct
 import heapq
+from collections import Counter
 from utils.bit_io import BitWriter, BitReader
 
 
 class Huffman:
     """
     Huffman coding for data compression and decompression.
+
+    The nodes of the Huffman tree are stored as a struct of arrays: each node is an index
+    into the parallel lists 'left', 'right' and 'symbols', and the root is the index of its node.
     """
     R = 256  # ASCII characters
+    LOOKUP_BITS = 12  # Maximum number of bits decoded at once with the lookup table
+    NONE = -1  # Child index of a leaf node
 
-    class Node:
+    def __init__(self):
         """
-        A node in the Huffman tree.
+        Initialize the Huffman encoder/decoder.
         """
+        self.root = None
+        self.left = []   # Index of the left child of each node, NONE for leaves
+        self.right = []  # Index of the right child of each node, NONE for leaves
+        self.symbols = []  # Byte value stored in each leaf, None for internal nodes
+        self.bit_reader = None
+        self.bit_writer = None
 
-        def __init__(self, char, frequency, left=None, right=None):
-            """
-            Initialize a Huffman tree node.
-
-            Args:
-                char: The character stored in the node.
-                frequency: The frequency of the character.
-                left: The left child node.
-                right: The right child node.
-            """
-            self.char = char
-            self.frequency = frequency
-            self.left = left
-            self.right = right
+    def new_node(self, symbol, left=NONE, right=NONE):
+        """
+        Append a node to the Huffman tree.
 
-        def is_leaf(self):
-            """
-            Check if the node is a leaf node.
+        Args:
+            symbol: The byte value stored in the node, None for an internal node.
+            left: The index of the left child node.
+            right: The index of the right child node.
 
-            Returns:
-                bool: True if the node is a leaf node, False otherwise.
-            """
-            return self.left is None and self.right is None
+        Returns:
+            int: The index of the new node.
+        """
+        self.symbols.append(symbol)
+        self.left.append(left)
+        self.right.append(right)
+        return len(self.symbols) - 1
 
-        def __lt__(self, other):
-            """
-            Less-than comparison based on frequency, for use in priority queue.
+    def clear_nodes(self):
+        """
+        Remove all the nodes of the Huffman tree.
+        """
+        self.root = None
+        self.left = []
+        self.right = []
+        self.symbols = []
 
-            Args:
-                other: Another Huffman.Node to compare with.
+    def is_leaf(self, node):
+        """
+        Check if a node is a leaf node.
 
-            Returns:
-                bool: True if this node's frequency is less than the other node's frequency.
-            """
-            return self.frequency < other.frequency
+        Args:
+            node: The index of the node.
 
-    def __init__(self):
-        """
-        Initialize the Huffman encoder/decoder.
+        Returns:
+            bool: True if the node is a leaf node, False otherwise.
         """
-        self.root = None
-        self.bit_reader = None
-        self.bit_writer = None
+        return self.left[node] == Huffman.NONE
 
     def expand(self, compressed_file, expanded_file, trie_file):
         """
@@ -71,44 +77,13 @@ class Huffman:
         self.root = self.read_trie(trie_file)
 
         # Open the input file in binary read mode and the output file in write mode
-        with open(compressed_file, 'rb') as infile, open(expanded_file, 'w') as outfile:
+        with open(compressed_file, 'rb') as infile, open(expanded_file, 'wb') as outfile:
 
             # Read the number of characters that are encoded in 16 bits
             total_chars = struct.unpack('H', infile.read(2))[0]
 
-            # Initialize the counter for the number of characters written to the output file
-            char_written = 0
-
-            # Initialize traversal from the root node of the trie
-            node = self.root
-
-            # Read bytes from the input file
-            while byte := infile.read(1):
-
-                # Convert the byte to its binary representation (8 bits)
-                binary_representation = format(ord(byte), '08b')
-
-                # Iterate over each bit in the binary representation
-                for bit in binary_representation:
-
-                    # Traverse to the left child node if the bit is '0'
-                    if bit == '0':
-                        node = node.left
-
-                    # Traverse to the right child node if the bit is '1'
-                    else:
-                        node = node.right
-
-                    # If the current node is a leaf, write the character to the output file
-                    # and reset the traversal to the root node
-                    if node.is_leaf():
-                        outfile.write(node.char)
-                        node = self.root
-
-                        # Check if the total number of characters has been written
-                        char_written += 1
-                        if char_written == total_chars:
-                            break
+            # Decode the bytes and write them to the output file
+            outfile.write(bytes(self._decode(infile.read(), total_chars)))
 
     def expand_indices(self, compressed_file, trie_file):
         """
@@ -122,48 +97,112 @@ class Huffman:
         """
         # Decode the encoded trie from the file and set the root node
         self.root = self.read_trie(trie_file)
-        indices = []
 
-        # Open the input file in binary read mode and the output file in write mode
+        # Open the input file in binary read mode
         with open(compressed_file, 'rb') as infile:
 
             # Read the number of characters that are encoded in 16 bits
             total_chars = struct.unpack('H', infile.read(2))[0]
 
-            # Initialize the counter for the number of characters written to the output file
-            char_written = 0
+            # Decode the indices
+            return self._decode(infile.read(), total_chars)
 
-            # Initialize traversal from the root node of the trie
-            node = self.root
+    def build_decode_table(self):
+        """
+        Builds a lookup table to decode several bits at once.
+        The table is indexed by the next 'table_bits' bits of the input. Each entry holds the node
+        reached by following those bits from the root and the number of bits used to reach it.
+        Codes no longer than 'table_bits' lead to a leaf, longer codes lead to an internal node
+        from which the decoding continues bit by bit.
 
-            # Read bytes from the input file
-            while byte := infile.read(1):
+        Returns:
+            tuple: The number of bits used to index the table and the table itself.
+        """
+        table_bits = min(max(self.build_code()[1]), Huffman.LOOKUP_BITS)
+        table = [None] * (1 << table_bits)
+        self._build_decode_table(table, table_bits)
+        return table_bits, table
 
-                # Convert the byte to its binary representation (8 bits)
-                binary_representation = format(ord(byte), '08b')
+    def _build_decode_table(self, table, table_bits):
+        """
+        Fills the entries of the decoding table by traversing the Huffman tree with an explicit stack.
+
+        Args:
+            table: The decoding table.
+            table_bits: The number of bits used to index the table.
+        """
+        stack = [(self.root, 0, 0)]
 
-                # Iterate over each bit in the binary representation
-                for bit in binary_representation:
+        while stack:
+            node, code, length = stack.pop()
 
-                    # Traverse to the left child node if the bit is '0'
-                    if bit == '0':
-                        node = node.left
+            # Every index starting with the current code leads to this node
+            if self.is_leaf(node) or length == table_bits:
+                padding = table_bits - length
+                table[code << padding:(code + 1) << padding] = [(node, length)] * (1 << padding)
+                continue
 
-                    # Traverse to the right child node if the bit is '1'
-                    else:
-                        node = node.right
+            stack.append((self.left[node], code << 1, length + 1))
+            stack.append((self.right[node], (code << 1) | 1, length + 1))
 
-                    # If the current node is a leaf, write the character to the output file
-                    # and reset the traversal to the root node
-                    if node.is_leaf():
-                        indices.append(ord(node.char))
-                        node = self.root
+    def _decode(self, content, total_chars):
+        """
+        Decode the given number of characters from the compressed content.
 
-                        # Check if the total number of characters has been written
-                        char_written += 1
-                        if char_written == total_chars:
-                            break
-        return indices
+        Args:
+            content: A bytes object with the encoded bits.
+            total_chars: The number of characters to decode.
+
+        Returns:
+            list: The decoded byte values.
+        """
+        # A trie with a single character uses codes of zero bits
+        if self.is_leaf(self.root):
+            return [self.symbols[self.root]] * total_chars
+
+        table_bits, table = self.build_decode_table()
+        mask = (1 << table_bits) - 1
+        left, right, symbols = self.left, self.right, self.symbols
+        decoded = []
+
+        # Buffer of bits read from the content but not decoded yet
+        bits = 0
+        length_bits = 0
+        position = 0
+
+        while len(decoded) < total_chars:
+
+            # Make sure the buffer holds enough bits to index the table
+            while length_bits < table_bits and position < len(content):
+                bits = (bits << 8) | content[position]
+                position += 1
+                length_bits += 8
+
+            # Look up the next bits, padding with zeros at the end of the content
+            if length_bits >= table_bits:
+                index = (bits >> (length_bits - table_bits)) & mask
+            else:
+                index = (bits << (table_bits - length_bits)) & mask
+
+            node, length = table[index]
+            length_bits -= length
+
+            # The code is longer than the table index, continue traversing the trie bit by bit
+            while left[node] != Huffman.NONE:
+                if length_bits == 0:
+                    bits = content[position]
+                    position += 1
+                    length_bits = 8
+
+                length_bits -= 1
+                node = right[node] if (bits >> length_bits) & 1 else left[node]
+
+            decoded.append(symbols[node])
+
+            # Discard the bits already decoded
+            bits &= (1 << length_bits) - 1
+
+        return decoded
 
     def write_trie(self, trie_file):
         """
@@ -186,24 +225,28 @@ class Huffman:
 
     def _write_trie(self, node):
         """
-        Recursively write the Huffman trie to a BitWriter.
+        Write the Huffman trie to a BitWriter, in preorder, using an explicit stack.
 
         Args:
-            node: The current node in the Huffman tree.
+            node: The index of the root node of the Huffman tree.
         """
-        # If the current node is a leaf, write a '1' to indicate a leaf node
-        # Then write the binary representation of the character stored in the node
-        if node.is_leaf():
-            self.bit_writer.write_bit(1)
-            self.bit_writer.write_byte(node.char)
-            return
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+
+            # If the current node is a leaf, write a '1' to indicate a leaf node
+            # followed by the 8 bits of the character stored in the node
+            if self.is_leaf(node):
+                self.bit_writer.write_bits((1 << 8) | self.symbols[node], 9)
+                continue
 
-        # If the current node is an internal node, write a '0' to indicate it's not a leaf
-        self.bit_writer.write_bit(0)
+            # If the current node is an internal node, write a '0' to indicate it's not a leaf
+            self.bit_writer.write_bit(0)
 
-        # Recursively write the left and right child nodes
-        self._write_trie(node.left)
-        self._write_trie(node.right)
+            # Push the right child first so that the left subtree is written first
+            stack.append(self.right[node])
+            stack.append(self.left[node])
 
     def read_trie(self, trie_file):
         """
@@ -213,7 +256,7 @@ class Huffman:
             trie_file: The file containing the encoded trie.
 
         Returns:
-            Huffman.Node: The root node of the Huffman tree.
+            int: The index of the root node of the Huffman tree.
         """
         # Open the specified file in binary read mode
         with open(trie_file, 'rb') as file:
@@ -226,28 +269,43 @@ class Huffman:
 
     def _read_trie(self):
         """
-        Recursively read the Huffman trie from a BitReader.
+        Read the Huffman trie in preorder from a BitReader, using an explicit stack.
 
         Returns:
-            Huffman.Node: The current node in the Huffman tree.
+            int: The index of the root node of the Huffman tree.
         """
-        # If the next bit is '1', it's a leaf node
-        if self.bit_reader.read_bit() == '1':
+        self.clear_nodes()
+        root = None
+
+        # Internal nodes whose children have not been read yet
+        pending = []
+
+        while True:
+            # If the next bit is 1, it's a leaf node
+            if self.bit_reader.read_bit():
 
-            # Read the 8 bits corresponding to the character's ASCII value
-            # Convert the binary string to an ASCII value and then to a character
-            # Create a leaf node with the character, frequency = 0, and no children
-            ascii_value = int(self.bit_reader.read_byte(), 2)
-            char = chr(ascii_value)
-            return Huffman.Node(char, 0)
+                # Read the 8 bits corresponding to the character's ASCII value
+                # Create a leaf node with the character and no children
+                node = self.new_node(self.bit_reader.read_byte())
 
-        # If the next bit is '0', it's an internal node. Recursively read the left and right nodes
-        node_left = self._read_trie()
-        node_right = self._read_trie()
+            # If the next bit is 0, it's an internal node, its children come next
+            else:
+                node = self.new_node(None)
 
-        # Create an internal node with no character value, frequency = 0,
-        # and the corresponding left and right children
-        return Huffman.Node(None, 0, node_left, node_right)
+            # Attach the node to the deepest internal node still missing a child
+            if root is None:
+                root = node
+            elif self.left[pending[-1]] == Huffman.NONE:
+                self.left[pending[-1]] = node
+            else:
+                self.right[pending.pop()] = node
+
+            if self.symbols[node] is None:
+                pending.append(node)
+
+            # Every internal node has both children, the trie is complete
+            if not pending:
+                return root
 
     def build_trie(self, frequencies):
         """
@@ -257,29 +315,31 @@ class Huffman:
             frequencies: A list of frequencies for each character.
 
         Returns:
-            Huffman.Node: The root node of the Huffman tree.
+            int: The index of the root node of the Huffman tree.
         """
-        # Initialize a priority queue with singleton tries for each character with a non-zero frequency
-        priority_queue = []
-        for i in range(Huffman.R):
-            if frequencies[i] > 0:
-                heapq.heappush(priority_queue, Huffman.Node(chr(i), frequencies[i]))
+        self.clear_nodes()
+
+        # Initialize a priority queue with singleton tries for each character with a non-zero frequency.
+        # The entries are (frequency, node) pairs, ties are broken by node index.
+        # The queue is built in linear time with heapify rather than one push per character.
+        priority_queue = [(frequencies[i], self.new_node(i)) for i in range(Huffman.R) if frequencies[i] > 0]
+        heapq.heapify(priority_queue)
 
         # Repeat the process until there is only one trie left in the priority queue
         while len(priority_queue) > 1:
 
             # Remove the two nodes with the smallest frequencies
-            node_x = heapq.heappop(priority_queue)
-            node_y = heapq.heappop(priority_queue)
+            frequency_x, node_x = heapq.heappop(priority_queue)
+            frequency_y, node_y = heapq.heappop(priority_queue)
 
             # Merge two smallest tries with a internal node as parent
-            parent = Huffman.Node(None, node_x.frequency + node_y.frequency, node_x, node_y)
+            parent = self.new_node(None, node_x, node_y)
 
             # Put the new trie in the priority queue
-            heapq.heappush(priority_queue, parent)
+            heapq.heappush(priority_queue, (frequency_x + frequency_y, parent))
 
         # Return the root of the trie
-        return heapq.heappop(priority_queue)
+        return heapq.heappop(priority_queue)[1]
 
     def compress(self, input_file, compressed_file, trie_file):
         """
@@ -291,38 +351,11 @@ class Huffman:
             compressed_file: The output file for the compressed data.
             trie_file: The file to write the encoded trie to.
         """
-        with open(input_file, 'r') as infile, open(compressed_file, 'wb') as outfile:
-            # Read the entire input file content
+        # Read the entire input file content as bytes, each byte is a value below R
+        with open(input_file, 'rb') as infile:
             content = infile.read()
 
-            # Tabulate frequency counts for each character in the input content
-            frequencies = [0] * Huffman.R
-            for char in content:
-                frequencies[ord(char)] += 1
-
-            # Build the Huffman coding trie based on frequency counts
-            self.root = self.build_trie(frequencies)
-
-            # Write the Huffman trie to the trie_file for use by the decoder
-            self.write_trie(trie_file)
-
-            # Build the symbol table for encoding using the Huffman trie
-            symbol_table = self.build_code()
-
-            # Open a BitWriter instance and write the number of characters in the content
-            writer = BitWriter(outfile)
-            number_chars = len(content)
-            outfile.write(struct.pack('H', number_chars))
-            
-            # Encode the input content using the Huffman code and write to the compressed file
-            for char in content:
-                code = symbol_table[ord(char)]
-
-                for bit in code:
-                    writer.write_bit(bit)
-
-            # Close the BitWriter to ensure all remaining bits are written to the file
-            writer.close()
+        self.compress_indices(content, compressed_file, trie_file)
 
     def compress_indices(self, content, compressed_file, trie_file):
         """
@@ -331,7 +364,7 @@ class Huffman:
         This is specially adapted to work with indices for Burrows-Wheeler.
 
         Args:
-            content (list): The input data to be compressed.
+            content (bytes): The input values to be compressed, each one below R.
             compressed_file (str): The path to the file where the compressed data will be written.
             trie_file (str): The path to the file where the Huffman trie will be written.
         """
@@ -339,8 +372,8 @@ class Huffman:
 
             # Tabulate frequency counts for each value in the input content
             frequencies = [0] * Huffman.R
-            for value in content:
-                frequencies[value] += 1
+            for value, frequency in Counter(content).items():
+                frequencies[value] = frequency
 
             # Build the Huffman coding trie based on frequency counts
             self.root = self.build_trie(frequencies)
@@ -349,7 +382,7 @@ class Huffman:
             self.write_trie(trie_file)
 
             # Build the symbol table for encoding using the Huffman trie
-            symbol_table = self.build_code()
+            codes, lengths = self.build_code()
 
             # Open a BitWriter instance and write the number of characters in the content
             writer = BitWriter(outfile)
@@ -358,44 +391,46 @@ class Huffman:
             
             # Encode the input content using the Huffman code and write to the compressed file
             for value in content:
-                code = symbol_table[value]
-
-                for bit in code:
-                    writer.write_bit(bit)
+                writer.write_bits(codes[value], lengths[value])
 
             # Close the BitWriter to ensure all remaining bits are written to the file
             writer.close()
 
     def build_code(self):
         """
-        Builds the symbol table for Huffman encoding. Each character gets its corresponding binary code.
+        Builds the symbol table for Huffman encoding. Each character gets its corresponding binary code,
+        stored as an integer together with its length in bits.
 
         Returns:
-            symbol_table: A list of binary codes for each character.
+            tuple: A list with the binary code of each character and a list with the length of each code.
         """
-        symbol_table = [''] * Huffman.R
-        self._build_code(symbol_table, self.root, "")
-        return symbol_table
+        codes = [0] * Huffman.R
+        lengths = [0] * Huffman.R
+        self._build_code(codes, lengths)
+        return codes, lengths
 
-    def _build_code(self, symbol_table, node, code):
+    def _build_code(self, codes, lengths):
         """
-        Recursively builds the Huffman encoding for each character by traversing the Huffman tree.
+        Builds the Huffman encoding for each character by traversing the Huffman tree with an explicit stack.
 
         Args:
-            symbol_table: The table to store binary codes for characters.
-            node: The current node in the Huffman tree.
-            code: The binary code generated for the current traversal path.
+            codes: The table to store the binary codes for characters.
+            lengths: The table to store the length of the binary codes.
         """
-        # If the node is a leaf, assign the generated code to the corresponding character in the symbol table
-        if node.is_leaf():
-            symbol_table[ord(node.char)] = code
-            return
+        stack = [(self.root, 0, 0)]
+
+        while stack:
+            node, code, length = stack.pop()
 
-        # Traverse left and add '0' to the code
-        self._build_code(symbol_table, node.left, code + '0')
+            # If the node is a leaf, assign the generated code to the corresponding character in the symbol table
+            if self.is_leaf(node):
+                codes[self.symbols[node]] = code
+                lengths[self.symbols[node]] = length
+                continue
 
-        # Traverse right and add '1' to the code
-        self._build_code(symbol_table, node.right, code + '1')
+            # Traverse left appending a 0 bit to the code, and right appending a 1 bit
+            stack.append((self.left[node], code << 1, length + 1))
+            stack.append((self.right[node], (code << 1) | 1, length + 1))
 
 
 def main():
@@ -1,12 +1,58 @@
-from utils.tst import TST
-from utils.bit_io import BitWriter, BitReader
+from itertools import chain, islice
 
 
-R = 256  # ASCII characters
+R = 256  # Extended ASCII, one codeword per byte value
 CODE_WIDTH = 12  # Codeword width
 NUM_CODES = 4096  # Number of codewords 2^12
+BLOCK_SIZE = 1 << 16  # Size of the blocks read from the input and written to the output
 
 
+def pack_codewords(codewords):
+    """
+    Packs 12-bit codewords into bytes, two codewords into every three bytes.
+
+    The bytes are the same as writing each codeword with a BitWriter, without going
+    through its general bit buffer for every codeword.
+
+    Args:
+        codewords (list): The codewords to pack, in order.
+
+    Returns:
+        bytearray: The packed codewords. An odd last codeword takes two bytes, padded with zeros.
+    """
+    packed = bytearray()
+
+    # Each pair of codewords makes a 24-bit integer, written as three bytes
+    for first, second in zip(codewords[::2], codewords[1::2]):
+        packed += ((first << CODE_WIDTH) | second).to_bytes(3, 'big')
+
+    if len(codewords) % 2:
+        packed += (codewords[-1] << 4).to_bytes(2, 'big')
+
+    return packed
+
+def unpack_codewords(content):
+    """
+    Unpacks 12-bit codewords from bytes, two codewords from every three bytes.
+
+    Args:
+        content (bytes): The packed codewords.
+
+    Returns:
+        list: The codewords, in order. Two trailing bytes hold one last codeword.
+    """
+    codewords = []
+
+    # The first codeword takes the first byte and the high half of the second one,
+    # the second codeword takes the low half of the second byte and the third byte
+    for first, middle, last in zip(content[0::3], content[1::3], content[2::3]):
+        codewords += ((first << 4) | (middle >> 4), ((middle & 0xF) << 8) | last)
+
+    if len(content) % 3 == 2:
+        codewords.append((content[-2] << 4) | (content[-1] >> 4))
+
+    return codewords
+
 def compress(input_file, compressed_file):
     """
     Compresses the input file using the LZW (Lempel-Ziv-Welch)
@@ -16,47 +62,61 @@ def compress(input_file, compressed_file):
         input_file: Path to the input file to be compressed.
         compressed_file: Path to the output file where compressed data will be written.
     """
-    # Create a Ternary Search Trie to use as a symbol table.
-    # During compression, we need to repeatedly look for the longest prefix that matches the current input.
-    # A Ternary Search Trie (TST) is efficient for this purpose because it provides fast lookups, insertions, and deletions.
-    symbol_table = TST()
+    # Create a dictionary to use as a symbol table.
+    # During compression, we repeatedly extend the longest prefix matched so far by the next input character.
+    # Keying the codewords by (codeword of the prefix, next byte) makes each extension a single lookup,
+    # instead of searching the whole prefix again in a trie.
+    # The empty prefix has no codeword, EMPTY stands for it.
+    EMPTY = -1
+    symbol_table = {}
     for i in range(R):
-        # Codewords for singlechars, radix R keys
-        symbol_table.put(chr(i), i)
+        # Codewords for single bytes, radix R keys
+        symbol_table[(EMPTY, i)] = i
 
     # We start the new coding from R + 1.
     # The value R is reserved for the end-of-file (EOF) codeword.
     code = R + 1
     EOF = R
 
-    with open(input_file, 'r') as infile, open(compressed_file, 'wb') as outfile:
-        # Read all the content of the input file
-        content = infile.read()
-
-        # Initialize a BitWriter object to handle bit-level writing
-        writer = BitWriter(outfile)
-
-        while len(content) > 0:
-            # Find longest prefix match
-            longest_prefix = symbol_table.longest_prefix_of(content)
-
-            # Write W-bit codeword for longest_prefix
-            writer.write_bits(symbol_table.get(longest_prefix), CODE_WIDTH)
-
-            len_prefix = len(longest_prefix)
-
-            if len_prefix < len(content) and code < NUM_CODES:
-
-                # Add new codeword to the trie, including the next character in the input
-                symbol_table.put(content[0:len_prefix + 1], code)
+    with open(input_file, 'rb') as infile, open(compressed_file, 'wb') as outfile:
+        # Collect the codewords and write them packed, once a block of them is complete.
+        # The block has an even number of codewords, so no codeword is split between two blocks.
+        codewords = []
+
+        # Codeword of the longest prefix matched so far
+        prefix = EMPTY
+
+        # Read the input file block by block, iterating over bytes yields their integer values.
+        # The prefix matched so far carries over to the next block, so the codewords
+        # are the same as if the whole content had been read at once.
+        for byte in chain.from_iterable(iter(lambda: infile.read(BLOCK_SIZE), b'')):
+            # Extend the prefix while it is still in the symbol table
+            extended = symbol_table.get((prefix, byte))
+            if extended is not None:
+                prefix = extended
+                continue
+
+            # Write W-bit codeword for the longest prefix match
+            codewords.append(prefix)
+            if len(codewords) == BLOCK_SIZE:
+                outfile.write(pack_codewords(codewords))
+                codewords.clear()
+
+            if code < NUM_CODES:
+                # Add new codeword to the symbol table, including the next byte in the input
+                symbol_table[(prefix, byte)] = code
                 code += 1
 
-            # Crop the input until the characters we haven't encoded
-            content = content[len_prefix:]
+            # Start a new prefix with the byte we haven't encoded, its codeword is its value
+            prefix = byte
+
+        # Write the codeword of the last prefix
+        if prefix != EMPTY:
+            codewords.append(prefix)
 
-        # Write stop codeword and close input stream
-        writer.write_bits(EOF, CODE_WIDTH)
-        writer.close()
+        # Write stop codeword and the codewords left
+        codewords.append(EOF)
+        outfile.write(pack_codewords(codewords))
 
 def expand(compressed_file, output_file):
     """
@@ -69,35 +129,36 @@ def expand(compressed_file, output_file):
     """
 
     # Create a list to use as a symbol table.
-    # Now we work with a predefined and static set of codewords that map to strings.
+    # Now we work with a predefined and static set of codewords that map to byte strings.
     # A list allows for efficient access by index.
-    symbol_table = [""] * NUM_CODES
-
     # Initialize table for single-character codewords.
     # Each index represents an ASCII character.
-    for i in range(R):
-        symbol_table[i] = chr(i)
+    symbol_table = [bytes([i]) for i in range(R)] + [b""] * (NUM_CODES - R)
 
     # We start the new coding from R + 1.
     # The value R is reserved for the end-of-file (EOF) codeword.
     next_code = R + 1
     EOF = R
 
-    with open(compressed_file, 'rb') as infile, open(output_file, 'w') as outfile:
-        # Initialize a BitReader object to handle bit-level reading from the compressed file
-        reader = BitReader(infile.read())
+    with open(compressed_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        # Read all the codewords of the compressed file at once
+        codewords = unpack_codewords(infile.read())
+
+        # Accumulate the decompressed data and write it to the output file by blocks
+        output = bytearray()
 
         # Read the first codeword from the input.
         # Use the codeword to get the corresponding string from the symbol table.
-        codeword = int(reader.read_bits(CODE_WIDTH), 2)
-        value = symbol_table[codeword]
-
-        while True:
-            # Write the current substring to the output file.
-            outfile.write(value)
+        # An empty input only holds the EOF codeword, which maps to an empty string.
+        value = symbol_table[codewords[0]]
 
-            # Read the next codeword from the input file.
-            codeword = int(reader.read_bits(CODE_WIDTH), 2)
+        # Read the next codewords
+        for codeword in islice(codewords, 1, None):
+            # Append the current substring to the output.
+            output += value
+            if len(output) >= BLOCK_SIZE:
+                outfile.write(output)
+                output.clear()
 
             # If the codeword is the EOF marker, break the loop.
             if codeword == EOF:
@@ -110,17 +171,19 @@ def expand(compressed_file, output_file):
             # equals the codeword we have not read yet
             if next_code == codeword:
                 # Construct the new string from the current string by adding its first character
-                current_string = value + value[0]
+                current_string = value + value[:1]
 
             # If there is still room in the symbol table
             if next_code < NUM_CODES:
                 # Add new entry to the symbol table.
-                symbol_table[next_code] = value + current_string[0]
+                symbol_table[next_code] = value + current_string[:1]
                 next_code += 1
 
             # Update the value for the next iteration
             value = current_string
 
+        outfile.write(output)
+
 
 def main():
     """
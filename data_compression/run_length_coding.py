@@ -1,7 +1,9 @@
-import struct
+import re
 
 R = 256
 lg_R = 8
+RUNS = re.compile('0+|1+')  # Maximal runs of equal bits
+SPLIT_RUN = bytes([R - 1, 0])  # A run of maximum length followed by a run of length 0
 
 
 def compress(input_file, output_file):
@@ -15,38 +17,34 @@ def compress(input_file, output_file):
     Returns:
         None
     """
-    count = 0
-    old = '0'  # Initialize the starting bit to '0'
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        content = infile.read()
 
-    with open(input_file, 'r') as infile, open(output_file, 'wb') as outfile:
+        # Transform the whole content to its binary representation at once
+        bits = format(int.from_bytes(content, 'big'), f'0{lg_R * len(content)}b') if content else ''
 
-        # Read one byte at a time from the input file until the end of the file is reached
-        while byte := infile.read(1):
+        # Lengths of the runs of equal bits. Runs alternate and the first one is a run of '0',
+        # so if the content starts with '1' it begins with a run of length 0
+        runs = [match.end() - match.start() for match in RUNS.finditer(bits)]
+        if not bits or bits[0] == '1':
+            runs.insert(0, 0)
 
-            # Transform to bynary representation
-            binary_representation = format(ord(byte), '08b')
+        compressed = bytearray()
+        for count in runs:
 
-            for bit in binary_representation:
+            # Runs longer than the maximum are split, interspersing runs of length 0.
+            # Long uniform stretches are spliced in at once rather than one maximum run at a time.
+            splits, count = divmod(count, R - 1)
+            if splits and count == 0:
+                splits -= 1
+                count = R - 1
 
-                # If the bit changed then write the number of times it appeared
-                if bit != old:
-                    outfile.write(struct.pack('B', count))
+            if splits:
+                compressed += SPLIT_RUN * splits
 
-                    # Reset the count
-                    count = 0
-                    old = bit
+            compressed.append(count)
 
-                # We have reached the maximum, we intersperse runs of length 0
-                elif count == R - 1:
-                    outfile.write(struct.pack('B', count))
-                    count = 0
-                    outfile.write(struct.pack('B', count))
-
-                # Update count
-                count += 1
-
-        # Write the last sequence of bits
-        outfile.write(struct.pack('B', count))
+        outfile.write(compressed)
 
 
 def expand(input_file, output_file):
@@ -62,26 +60,23 @@ def expand(input_file, output_file):
     """
     bit = 0  # Initialize the starting bit to '0'
 
-    with open(input_file, 'rb') as infile, open(output_file, 'w') as outfile:
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
         # Initialize a buffer to accumulate bits until a full byte is formed and a counter to track the number of bits
         bits = 0
         length_bits = 0
+        expanded = bytearray()
 
-        # Read one byte at a time from the input file until the end of the file is reached
-        while run := infile.read(1):
-
-            # Unpack the byte to get the number of consecutive bits to append
-            run_length = struct.unpack('B', run)[0]
+        # Iterating over the bytes of the input file yields the run lengths directly as integers
+        for run_length in infile.read():
 
             # Append the current bit to the list run_length times
             for _ in range(run_length):
                 bits = (bits << 1) | bit
                 length_bits += 1
 
-                # When we've accumulated enough bits to form a byte (8 bits), write it as an ASCII character
+                # When we've accumulated enough bits to form a byte (8 bits), append it to the output
                 if length_bits == lg_R:
-                    ascii_character = chr(bits)
-                    outfile.write(ascii_character)
+                    expanded.append(bits)
 
                     # Reset the buffer and counter to start accumulating the next byte
                     bits = 0
@@ -90,6 +85,8 @@ def expand(input_file, output_file):
             # Change the value of bit
             bit = 1 if bit == 0 else 0
 
+        outfile.write(expanded)
+
 
 def main():
     """
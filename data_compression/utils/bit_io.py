@@ -1,7 +1,10 @@
 class BitWriter:
     """
     A class for writing bits to a file. This class buffers bits and writes them to the file in byte format.
+    Complete bytes are accumulated in a bytearray and written to the file in large chunks.
     """
+    BUFFER_SIZE = 1 << 16  # Number of bytes accumulated before writing them to the file
+
     def __init__(self, file):
         """
         Initialize the BitWriter with the given file.
@@ -12,53 +15,54 @@ class BitWriter:
         self.file = file
         self.bits = 0           # Buffer to store bits before writing them as a byte
         self.length_bits = 0    # Number of bits currently in the buffer
+        self.buffer = bytearray()  # Complete bytes not yet written to the file
 
     def write_bit(self, bit):
         """
-        Write a single bit to the buffer. When the buffer is full, write it to the file as a byte.
+        Write a single bit to the buffer.
         
         Args:
             bit: The bit to write (0 or 1).
         """
-        self.bits = (self.bits << 1) | int(bit)
-        self.length_bits += 1
-
-        # When the buffer is full, write it to the file as a byte
-        if self.length_bits == 8:
-            self.file.write(bytes([self.bits]))
-            self.bits = 0
-            self.length_bits = 0
+        self.write_bits(int(bit), 1)
 
     def write_byte(self, byte):
         """
-        Write a byte to the buffer bit by bit.
+        Write a byte to the buffer as 8 bits.
         
         Args:
-            byte: The byte to write.
+            byte: The byte to write, as an integer (0 to 255).
         """
-
-        # Convert the byte to its binary representation
-        binary_representation = format(ord(byte), '08b')
-
-        # Write each bit to the buffer
-        for bit in binary_representation:
-            self.write_bit(bit)
+        self.write_bits(byte, 8)
 
     def write_bits(self, value, width):
         """
-        Write a character to the buffer as a specified number of bits.
+        Write an integer value to the buffer as a specified number of bits.
         
         Args:
-            char: The character to write.
+            value: The integer value to write.
             width: The number of bits to use for the binary representation.
         """
 
-        # Convert the character to its binary representation, padded to the specified width
-        binary_representation = format(value, '0' + str(width) + 'b')
+        # Append the bits of the value to the buffer
+        self.bits = (self.bits << width) | value
+        self.length_bits += width
 
-        # Write each bit to the buffer
-        for bit in binary_representation:
-            self.write_bit(bit)
+        # Append every complete byte to the output, keeping the remaining bits in the buffer
+        while self.length_bits >= 8:
+            self.length_bits -= 8
+            self.buffer.append(self.bits >> self.length_bits)
+            self.bits &= (1 << self.length_bits) - 1
+
+        if len(self.buffer) >= BitWriter.BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Write the complete bytes accumulated so far to the file.
+        """
+        self.file.write(self.buffer)
+        self.buffer.clear()
 
     def close(self):
         """
@@ -68,15 +72,21 @@ class BitWriter:
         if self.length_bits > 0:
 
             # Pad the remaining bits to form a complete byte
-            self.bits = self.bits << (8 - self.length_bits)
-            self.file.write(bytes([self.bits]))
+            self.buffer.append(self.bits << (8 - self.length_bits))
+            self.bits = 0
+            self.length_bits = 0
+
+        self.flush()
 
 
 class BitReader:
     """
-    A class for reading bits and bytes from a binary string representation of content.
-    This class allows for sequential bit and byte reading.
+    A class for reading bits and bytes from binary content.
+    This class allows for sequential bit and byte reading. The bits are loaded from the content
+    into an integer buffer, 8 bytes at a time, and returned as integers.
     """
+    CHUNK_SIZE = 8  # Number of bytes loaded into the buffer at once
+
     def __init__(self, content):
         """
         Initialize the BitReader with the given binary content.
@@ -84,42 +94,63 @@ class BitReader:
         Args:
             content: A bytes object containing the binary content.
         """
-        # Convert the content to a binary string representation
-        self.binary_string = ''.join(format(byte, '08b') for byte in content)
-        self.index = 0  # Initialize the index for reading bits
+        self.content = content
+        self.position = 0       # Index of the next byte of the content to load
+        self.bits = 0           # Buffer to store the bits loaded but not read yet
+        self.length_bits = 0    # Number of bits currently in the buffer
+
+    def _fill(self, width):
+        """
+        Load bytes from the content until the buffer holds at least the given number of bits.
+
+        Args:
+            width: The number of bits needed in the buffer.
+
+        Raises:
+            EOFError: If the content does not have enough bits left.
+        """
+        while self.length_bits < width:
+            chunk = self.content[self.position: self.position + BitReader.CHUNK_SIZE]
+            if not chunk:
+                raise EOFError("No more bits to read")
+
+            self.bits = (self.bits << (8 * len(chunk))) | int.from_bytes(chunk, 'big')
+            self.length_bits += 8 * len(chunk)
+            self.position += len(chunk)
 
     def read_bit(self):
         """
-        Read a single bit from the binary string.
+        Read a single bit from the content.
         
         Returns:
-            The next bit in the binary string.
+            The next bit in the content, as an integer (0 or 1).
         """
-        bit = self.binary_string[self.index]  # Get the bit at the current index
-        self.index += 1  # Increment the index for the next read
-        return bit
+        return self.read_bits(1)
 
     def read_byte(self):
         """
-        Read the next byte (8 bits) from the binary string.
+        Read the next byte (8 bits) from the content.
         
         Returns:
-            The next byte in the binary string.
+            The next byte in the content, as an integer.
         """
-        byte = self.binary_string[self.index: self.index + 8]  # Get the byte at the current index
-        self.index += 8  # Increment the index by the length of a byte
-        return byte
+        return self.read_bits(8)
 
     def read_bits(self, width):
         """
-        Read the next specified number of bits from the binary string.
+        Read the next specified number of bits from the content.
         
         Args:
             width: The number of bits to read.
         
         Returns:
-            The next 'width' bits in the binary string.
+            The next 'width' bits in the content, as an integer.
         """
-        bits = self.binary_string[self.index: self.index + width]  # Get the bits at the current index
-        self.index += width  # Increment the index by the number of bits read
-        return bits
+        if self.length_bits < width:
+            self._fill(width)
+
+        # Take the highest bits of the buffer and discard them from it
+        self.length_bits -= width
+        value = self.bits >> self.length_bits
+        self.bits &= (1 << self.length_bits) - 1
+        return value
@@ -13,10 +13,15 @@ class TST:
         Each node contains a character, an optional value, and references to
         its left, middle, and right children.
         """
-        def __init__(self):
-            """Initializes a node in the TST with default values."""
+        def __init__(self, char=None):
+            """
+            Initializes a node in the TST with default values.
+
+            Args:
+                char (str): The character of the node.
+            """
             self.value = None
-            self.char = None
+            self.char = char
             self.left = None
             self.mid = None
             self.right = None
@@ -40,7 +45,7 @@ class TST:
 
     def _put(self, node, key, value, depth):
         """
-        Recursive helper method to insert a key-value pair into the TST.
+        Helper method to insert a key-value pair into the TST, descending it with a loop.
 
         Args:
             node (TST.Node): The current node in the TST.
@@ -51,31 +56,38 @@ class TST:
         Returns:
             TST.Node: The updated node in the TST.
         """
-        char = key[depth]
-
         # Base case: If the node is None, create a new node with the current character
         if node is None:
-            node = TST.Node()
-            node.char = char
+            node = TST.Node(key[depth])
 
-        # Recursive Exploration:
-        # Left branch
-        if char < node.char:
-            node.left = self._put(node.left, key, value, depth)
+        subtree = node
 
-        # Right branch
-        elif char > node.char:
-            node.right = self._put(node.right, key, value, depth)
+        while True:
+            char = key[depth]
 
-        # Middle branch, the key is not yet fully inserted
-        elif depth < len(key) - 1:
-            node.mid = self._put(node.mid, key, value, depth + 1)
+            # Left branch, create the child with the current character if needed
+            if char < node.char:
+                if node.left is None:
+                    node.left = TST.Node(char)
+                node = node.left
 
-        # Middle branch, we've reached the end of the key, store the value
-        else:
-            node.value = value
+            # Right branch, create the child with the current character if needed
+            elif char > node.char:
+                if node.right is None:
+                    node.right = TST.Node(char)
+                node = node.right
 
-        return node
+            # Middle branch, the key is not yet fully inserted
+            elif depth < len(key) - 1:
+                depth += 1
+                if node.mid is None:
+                    node.mid = TST.Node(key[depth])
+                node = node.mid
+
+            # Middle branch, we've reached the end of the key, store the value
+            else:
+                node.value = value
+                return subtree
 
     def contains(self, key):
         """
@@ -108,7 +120,7 @@ class TST:
 
     def _get(self, node, key, depth):
         """
-        Recursive helper method to retrieve the value associated with the given key.
+        Helper method to retrieve the node associated with the given key, descending the TST with a loop.
 
         Args:
             node (TST.Node): The current node in the TST.
@@ -118,29 +130,29 @@ class TST:
         Returns:
             TST.Node: The node associated with the key, or None if the key is not found.
         """
+        length = len(key)
 
-        # Base case
-        if node is None:
-            return None
+        while node is not None:
+            char = key[depth]
 
-        # Recursive Exploration:
-        char = key[depth]
+            # Left branch
+            if char < node.char:
+                node = node.left
 
-        # Left branch
-        if char < node.char:
-            return self._get(node.left, key, depth)
+            # Right branch
+            elif char > node.char:
+                node = node.right
 
-        # Right branch
-        elif char > node.char:
-            return self._get(node.right, key, depth)
+            # Middle branch: Traverse middle if the character matches and the key is not yet fully completed
+            elif depth < length - 1:
+                depth += 1
+                node = node.mid
 
-        # Middle branch: Traverse middle if the character matches and the key is not yet fully completed
-        elif depth < len(key) - 1:
-            return self._get(node.mid, key, depth + 1)
+            # Middle branch: If we've reached the end of the key, return the node
+            else:
+                return node
 
-        # Middle branch: If we've reached the end of the key, return the node
-        else:
-            return node
+        return None
 
     def __bool__(self):
         """
@@ -170,43 +182,60 @@ class TST:
         Returns:
             list: A list of keys that start with the given prefix.
         """
-        queue = []
-
         if prefix == "":
-            node_prefix = self.root
-        else:
-            node_prefix = self._get(self.root, prefix, 0)
-        
-        self._collect(node_prefix, prefix[0:-1], queue)
+            return list(self._collect(self.root, prefix))
+
+        # Node of the last character of the prefix
+        node_prefix = self._get(self.root, prefix, 0)
+
+        # The prefix does not exist in the TST
+        if node_prefix is None:
+            return []
+
+        queue = [prefix] if node_prefix.value is not None else []
+
+        # Only the middle branch continues the prefix, its siblings hold other keys
+        queue.extend(self._collect(node_prefix.mid, prefix))
         return queue
 
-    def _collect(self, node, prefix, queue):
+    def _collect(self, node, prefix):
         """
-        Helper method to collect all keys in the TST with the given prefix.
+        Helper generator to yield all keys in the TST below the given node, in order.
+
+        The TST is traversed with an explicit stack. The characters of the current key are kept
+        in a list, and each key is joined into a string only once, when it is yielded.
 
         Args:
-            node (TST.Node): The current node in the TST.
-            prefix (str): The prefix associated with the current node.
-            queue (list): The queue to collect the keys.
+            node (TST.Node): The node where the traversal starts.
+            prefix (str): The prefix associated with the node.
+
+        Yields:
+            str: The keys found below the node, in sorted order.
         """
+        chars = list(prefix)
 
-        # The key does not exist in the TST
-        if node is None:
-            return
+        # Each entry is a node, its depth and whether its own key is due,
+        # after its left branch and before its middle and right branches
+        stack = [(node, len(prefix), False)]
 
-        # Recursively explore the TST in order:
-        # Left branch
-        self._collect(node.left, prefix, queue)
+        while stack:
+            node, depth, visited = stack.pop()
 
-        # The node contains a value, add to the queue
-        if node.value is not None:
-            queue.append(prefix + node.char)
+            # The left branch is done, the node's character now ends the current prefix
+            if visited:
+                del chars[depth:]
+                chars.append(node.char)
 
-        # Middle branch
-        self._collect(node.mid, prefix + node.char, queue)
+                # The node contains a value, yield its key
+                if node.value is not None:
+                    yield "".join(chars)
 
-        # Right branch
-        self._collect(node.right, prefix, queue)
+            # Push the branches in reverse order: left, node, middle and then right are popped
+            elif node is not None:
+                stack.append((node.right, depth, False))
+                stack.append((node.mid, depth + 1, False))
+                stack.append((node, depth, True))
+                stack.append((node.left, depth, False))
 
     def delete(self, key):
         """
@@ -328,7 +357,7 @@ class TST:
 
     def _search(self, node, string, depth, length):
         """
-        Helper method to find the length of the longest prefix of the given string.
+        Helper method to find the length of the longest prefix of the given string, descending the TST with a loop.
 
         Args:
             node (TST.Node): The current node in the TST.
@@ -339,31 +368,28 @@ class TST:
         Returns:
             int: The length of the longest prefix of the input string that exists in the TST.
         """
+        length_string = len(string)
 
-        # Base cases
-        if node is None:
-            return length
+        while node is not None and depth < length_string:
+            char = string[depth]
 
-        if depth == len(string):
-            return length
+            if node.value is not None and node.char == char:
+                length = depth + 1  # Updates length
 
-        char = string[depth]
+            # Left branch
+            if char < node.char:
+                node = node.left
 
-        if node.value is not None and node.char == char:
-            length = depth + 1  # Updates length
+            # Right branch
+            elif char > node.char:
+                node = node.right
 
-        # Recursive Exploration:
-        # Left branch
-        if char < node.char:
-            return self._search(node.left, string, depth, length)
+            # Middle branch
+            else:
+                depth += 1
+                node = node.mid
 
-        # Right branch
-        elif char > node.char:
-            return self._search(node.right, string, depth, length)
-        
-        # Middle branch
-        else:
-            return self._search(node.mid, string, depth + 1, length)
+        return length
 
 
 def main():
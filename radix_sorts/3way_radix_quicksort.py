@@ -1,23 +1,58 @@
-def char_at(string, position):
+CUTOFF = 15  # Partitions with at most this many strings are sorted with insertion sort
+
+
+def insertion_sort(string_array, lo, hi, depth):
     """
-    Returns the character at the specified position in the string,
-    or '\0' if the position is out of bounds.
-    
+    Sorts a small partition of strings with insertion sort.
+    All the strings in the partition share their first 'depth' characters.
+
     Args:
-        string (str): The string to get the character from.
-        position (int): The position of the character in the string.
-    
+        string_array (list): The list of strings to be sorted.
+        lo (int): The lower index of the partition to sort.
+        hi (int): The higher index of the partition to sort.
+        depth (int): The number of characters shared by the strings of the partition.
+    """
+    for i in range(lo + 1, hi + 1):
+        string = string_array[i]
+        suffix = string[depth:]
+        j = i
+
+        # Shift the greater strings one position to the right
+        while j > lo and suffix < string_array[j - 1][depth:]:
+            string_array[j] = string_array[j - 1]
+            j -= 1
+
+        string_array[j] = string
+
+
+def median_of_three(string_array, lo, hi, depth):
+    """
+    Finds the string whose character at 'depth' is the median among the first, middle and last strings of a partition.
+
+    Args:
+        string_array (list): The list of strings to be sorted.
+        lo (int): The lower index of the partition.
+        hi (int): The higher index of the partition.
+        depth (int): The position of the character compared.
+
     Returns:
-        str: The character at the specified position or '\0' if out of bounds.
+        int: The index of the string with the median character.
     """
-    if position < len(string):
-        return string[position]
-    return '\0'
+    mid = (lo + hi) // 2
+
+    # Characters at 'depth', '' marks the end of the string
+    a, b, c = (string_array[k][depth] if depth < len(string_array[k]) else '' for k in (lo, mid, hi))
+
+    if a < b:
+        return mid if b < c else (hi if a < c else lo)
+
+    return lo if a < c else (hi if b < c else mid)
 
 
 def sort(string_array, lo, hi, depth):
     """
     Sorts the array of strings using three-way radix quicksort.
+    The partitions still to sort are kept in an explicit stack instead of recursing.
     
     Args:
         string_array (list): The list of strings to be sorted.
@@ -25,42 +60,56 @@ def sort(string_array, lo, hi, depth):
         hi (int): The higher index of the array to sort.
         depth (int): The current depth of the character being sorted.
     """
-    if hi <= lo:
-        return
+    stack = [(lo, hi, depth)]
 
-    # Initialize pointers for less than and greater than partitions
-    less_than, greater_than = lo, hi
+    while stack:
+        lo, hi, depth = stack.pop()
 
-    # Choose the partitioning element (pivot)
-    pivot = char_at(string_array[lo], depth)
+        # Small partitions are faster to sort with insertion sort
+        if hi - lo < CUTOFF:
+            insertion_sort(string_array, lo, hi, depth)
+            continue
 
-    # Initialize the current element pointer
-    i = lo
+        # Initialize pointers for less than and greater than partitions
+        less_than, greater_than = lo, hi
 
-    while i <= greater_than:
-        t = char_at(string_array[i], depth)
-        if t < pivot:
-            # Element is less than pivot, swap with element at less_than and move both pointers
-            string_array[less_than], string_array[i] = string_array[i], string_array[less_than]
-            i += 1
-            less_than += 1
+        # Choose the partitioning element (pivot) as the median of three and move it to the front.
+        # Sorted inputs and suffixes sharing long prefixes then still split into balanced partitions.
+        # The character at 'depth' is read inline, '' marks the end of the string.
+        median = median_of_three(string_array, lo, hi, depth)
+        string_array[lo], string_array[median] = string_array[median], string_array[lo]
+        first = string_array[lo]
+        pivot = first[depth] if depth < len(first) else ''
 
-        elif t > pivot:
-            # Element is greater than pivot, swap with element at greater_than and move greater_than pointer
-            string_array[i], string_array[greater_than] = string_array[greater_than], string_array[i]
-            greater_than -= 1
+        # Initialize the current element pointer
+        i = lo + 1
 
-        else:
-            # Element is equal to pivot, just move the current element pointer
-            i += 1
+        while i <= greater_than:
+            string = string_array[i]
+            t = string[depth] if depth < len(string) else ''
 
-    # Recursively sort the subarrays
-    sort(string_array, lo, less_than - 1, depth)
+            if t < pivot:
+                # Element is less than pivot, swap with element at less_than and move both pointers
+                string_array[less_than], string_array[i] = string, string_array[less_than]
+                i += 1
+                less_than += 1
 
-    if pivot != '\0':
-        sort(string_array, less_than, greater_than, depth + 1)
-    
-    sort(string_array, less_than + 1, hi, depth)
+            elif t > pivot:
+                # Element is greater than pivot, swap with element at greater_than and move greater_than pointer
+                string_array[i], string_array[greater_than] = string_array[greater_than], string
+                greater_than -= 1
+
+            else:
+                # Element is equal to pivot, just move the current element pointer
+                i += 1
+
+        # Push the subarrays to sort
+        stack.append((greater_than + 1, hi, depth))
+
+        if pivot != '':
+            stack.append((less_than, greater_than, depth + 1))
+
+        stack.append((lo, less_than - 1, depth))
 
 
 def quick_sort(string_array):
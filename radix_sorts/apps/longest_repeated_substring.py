@@ -1,21 +1,84 @@
-def longest_common_prefix(string_a, string_b):
+def suffix_array(string):
     """
-    Computes the length of the longest common prefix between two strings.
-    
+    Computes the suffix array of a string using prefix doubling.
+
+    The suffixes are first ranked by their first character. Each round then sorts them
+    by the pair of ranks of their first k characters and of the k characters that follow,
+    which ranks them by their first 2k characters, until all ranks are distinct.
+
     Args:
-        string_a (str): The first string.
-        string_b (str): The second string.
-    
+        string (str): The input string.
+
     Returns:
-        int: The length of the longest common prefix.
+        list: The starting indices of the suffixes of the string in sorted order.
+    """
+    n = len(string)
+
+    # Rank the suffixes by their first character
+    alphabet = {char: rank for rank, char in enumerate(sorted(set(string)))}
+    rank = [alphabet[char] for char in string]
+    suffixes = list(range(n))
+    width = 1
+
+    while True:
+        # Sort by the rank of the first 'width' characters, then by the rank of the next 'width' characters.
+        # Ranks are shifted by one so that 0 stands for the end of the string, which comes first.
+        following = [r + 1 for r in rank[width:]] + [0] * min(width, n)
+        keys = [(first_rank + 1) * (n + 1) + next_rank for first_rank, next_rank in zip(rank, following)]
+        suffixes.sort(key=keys.__getitem__)
+
+        # Assign new ranks, equal prefixes share the same rank
+        current = 0
+        for i in range(1, n):
+            if keys[suffixes[i]] != keys[suffixes[i - 1]]:
+                current += 1
+            rank[suffixes[i]] = current
+
+        # Every suffix has a distinct rank, the order is final
+        if current >= n - 1:
+            return suffixes
+
+        width <<= 1
+
+
+def lcp_array(string, suffixes):
     """
-    n = min(len(string_a), len(string_b))
+    Computes the longest common prefix of each pair of adjacent suffixes using Kasai's algorithm.
+
+    The suffixes are visited in the order of the string: when the suffix starting at i shares
+    h characters with its predecessor, the suffix starting at i + 1 shares at least h - 1.
+
+    Args:
+        string (str): The input string.
+        suffixes (list): The suffix array of the string.
+
+    Returns:
+        list: The length of the longest common prefix of each suffix in sorted order with the previous one (0 for the first).
+    """
+    n = len(string)
+    rank = [0] * n
+    for i, suffix in enumerate(suffixes):
+        rank[suffix] = i
+
+    lcp = [0] * n
+    length = 0
 
     for i in range(n):
-        if string_a[i] != string_b[i]:
-            return i
+        if rank[i] == 0:
+            length = 0
+            continue
 
-    return n
+        # Extend the common prefix with the previous suffix in sorted order
+        j = suffixes[rank[i] - 1]
+        while i + length < n and j + length < n and string[i + length] == string[j + length]:
+            length += 1
+
+        lcp[rank[i]] = length
+
+        if length > 0:
+            length -= 1
+
+    return lcp
 
 
 def longest_repeated_substring(string):
@@ -28,22 +91,17 @@ def longest_repeated_substring(string):
     Returns:
         str: The longest repeated substring.
     """
-    n = len(string)
-    suffixes = []
-
-    for i in range(n):
-        suffixes.append(string[i:])
-
-    suffixes.sort()
-    lrs = ""
+    if not string:
+        return ""
 
-    for i in range(n - 1):
-        length = longest_common_prefix(suffixes[i], suffixes[i + 1])
+    suffixes = suffix_array(string)
+    lcp = lcp_array(string, suffixes)
 
-        if length > len(lrs):
-            lrs = suffixes[i][0:length]
+    # The longest repeated substring is the longest prefix shared by two adjacent suffixes
+    length = max(lcp)
+    index = lcp.index(length)
 
-    return lrs
+    return string[suffixes[index]:suffixes[index] + length]
 
 
 def main():
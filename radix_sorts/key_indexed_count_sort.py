@@ -1,5 +1,9 @@
+from collections import Counter
+
+
 # Extended ASCII
 RADIX = 256
+CHARS = [chr(r) for r in range(RADIX)]  # Characters in the order of their keys
 
 
 def key_indexed_count_sort(char_array):
@@ -9,26 +13,23 @@ def key_indexed_count_sort(char_array):
     Args:
         char_array (list): The list of characters to be sorted.
     """
-    n = len(char_array)
-    count = [0] * (RADIX + 1)
-    aux = [''] * n
-
-    # Count frequencies of each letter using key as index
-    for char in char_array:
-        count[ord(char) + 1] += 1
-
-    # Compute frequency cumulates which specify destinations
-    for i in range(RADIX):
-        count[i + 1] += count[i]
-
-    # Access cumulates using key as index to move items
-    for char in char_array:
-        aux[count[ord(char)]] = char
-        count[ord(char)] += 1
-
-    # Copy back into original array
-    for i in range(n):
-        char_array[i] = aux[i]
+    # Count frequencies of each letter, the counting loop runs inside Counter
+    count = Counter(char_array)
+
+    # Only the RADIX characters have a key, the runs below would silently drop any other item
+    for char in count:
+        if len(char) != 1 or ord(char) >= RADIX:
+            raise ValueError(f"Item {char!r} is not a single extended ASCII character")
+
+    # Walk the keys in order, the cumulate of the previous keys is the destination of each key.
+    # Items with the same key are the same character, so they are moved at once
+    # by writing the run of the character over its destinations.
+    start = 0
+    for char in CHARS:
+        frequency = count.get(char)
+        if frequency:
+            char_array[start:start + frequency] = char * frequency
+            start += frequency
 
 
 def main():
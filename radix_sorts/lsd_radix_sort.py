@@ -1,3 +1,6 @@
+from itertools import chain
+
+
 # Extended ASCII
 RADIX = 256
 
@@ -10,28 +13,21 @@ def lsd_sort(string_array, width):
         string_array (list): The list of strings to be sorted.
         width (int): Fixed length of the strings in the array.
     """
-    n = len(string_array)
-    aux = [''] * n
+    # One bucket per character, the strings are appended to them in their current order.
+    # The buckets and their append methods are created once and emptied after each pass.
+    buckets = [[] for _ in range(RADIX)]
+    append = [bucket.append for bucket in buckets]
 
     for index in range(width - 1, -1, -1):
-        count = [0] * (RADIX + 1)
-
-        # Count frequencies of each letter using key as index
+        # Distribute the strings using key as index
         for string in string_array:
-            count[ord(string[index]) + 1] += 1
+            append[ord(string[index])](string)
 
-        # Compute frequency cumulates which specify destinations
-        for i in range(RADIX):
-            count[i + 1] += count[i]
-
-        # Access cumulates using key as index to move items
-        for string in string_array:
-            aux[count[ord(string[index])]] = string
-            count[ord(string[index])] += 1
+        # Concatenate the buckets back into the original array
+        string_array[:] = chain.from_iterable(buckets)
 
-        # Copy back into original array
-        for i in range(n):
-            string_array[i] = aux[i]
+        for bucket in buckets:
+            bucket.clear()
 
 
 def main():
@@ -1,27 +1,36 @@
 # Extended ASCII
 RADIX = 256
+CUTOFF = 15  # Subarrays with at most this many strings are sorted with insertion sort
 
 
-def char_at(string, position):
+def insertion_sort(string_array, lo, hi, depth):
     """
-    Returns the character at the specified position in the string,
-    or '\0' if the position is out of bounds.
-    
+    Sorts a small subarray of strings with insertion sort.
+    All the strings in the subarray share their first 'depth' characters.
+
     Args:
-        string (str): The string to get the character from.
-        position (int): The position of the character in the string.
-    
-    Returns:
-        str: The character at the specified position or '\0' if out of bounds.
+        string_array (list): The list of strings to be sorted.
+        lo (int): The lower index of the subarray to sort.
+        hi (int): The higher index of the subarray to sort.
+        depth (int): The number of characters shared by the strings of the subarray.
     """
-    if position < len(string):
-        return string[position]
-    return '\0'
+    for i in range(lo + 1, hi + 1):
+        string = string_array[i]
+        suffix = string[depth:]
+        j = i
+
+        # Shift the greater strings one position to the right
+        while j > lo and suffix < string_array[j - 1][depth:]:
+            string_array[j] = string_array[j - 1]
+            j -= 1
+
+        string_array[j] = string
 
 
 def sort(string_array, aux, lo, hi, depth):
     """
     Sorts the array of strings using MSD (Most Significant Digit) radix sort.
+    The subarrays still to sort are kept in an explicit stack instead of recursing.
     
     Args:
         string_array (list): The list of strings to be sorted.
@@ -31,41 +40,53 @@ def sort(string_array, aux, lo, hi, depth):
         depth (int): The current depth of the character being sorted.
     """
 
-    # Initialize flag to detect if we have reached the end of all strings at the current depth
-    end_reached = True
+    stack = [(lo, hi, depth)]
+
+    while stack:
+        lo, hi, depth = stack.pop()
+
+        # Small subarrays are faster to sort with insertion sort
+        if hi - lo < CUTOFF:
+            insertion_sort(string_array, lo, hi, depth)
+            continue
 
-    if hi <= lo:
-        return
+        # Compute the key of every string once: 0 past its end, ord + 1 for its character at 'depth'
+        strings = string_array[lo:hi + 1]
+        keys = [ord(string[depth]) + 1 if depth < len(string) else 0 for string in strings]
 
-    count = [0] * (RADIX + 2)
+        count = [0] * (RADIX + 2)
 
-    # Count frequencies of each letter using key as index
-    for i in range(lo, hi + 1):
-        count[ord(char_at(string_array[i], depth)) + 2] += 1
+        # Count frequencies of each key using key as index
+        for key in keys:
+            count[key + 1] += 1
 
-        if end_reached and char_at(string_array[i], depth) != '\0':
-            end_reached = False
+        # All the strings end here, the subarray is sorted
+        if count[1] == len(keys):
+            continue
 
-    # If all characters are null characters, terminate recursion
-    if end_reached:
-        return
+        # All the strings share the same character, they are already in place
+        if max(count) == len(keys):
+            stack.append((lo, hi, depth + 1))
+            continue
 
-    # Compute frequency cumulates which specify destinations
-    for i in range(RADIX):
-        count[i + 1] += count[i]
+        # Compute frequency cumulates which specify destinations
+        for r in range(RADIX + 1):
+            count[r + 1] += count[r]
 
-    # Access cumulates using key as index to move items
-    for i in range(lo, hi + 1):
-        aux[count[ord(char_at(string_array[i], depth)) + 1]] = string_array[i]
-        count[ord(char_at(string_array[i], depth)) + 1] += 1
+        # Access cumulates using key as index to move items
+        for key, string in zip(keys, strings):
+            aux[count[key]] = string
+            count[key] += 1
 
-    # Copy back into original array
-    for i in range(lo, hi + 1):
-        string_array[i] = aux[i - lo]
+        # Copy back into original array
+        string_array[lo:hi + 1] = aux[:len(keys)]
 
-    # Sort R subarrays recursively (one per character in R)
-    for r in range(RADIX):
-        sort(string_array, aux, lo + count[r], lo + count[r + 1] - 1, depth + 1)
+        # Push the R subarrays (one per character in R) to sort them by the next character.
+        # The strings that ended come first and are sorted already.
+        # Subarrays with less than two strings are already sorted and are skipped.
+        for r in range(1, RADIX + 1):
+            if count[r] - count[r - 1] > 1:
+                stack.append((lo + count[r - 1], lo + count[r] - 1, depth + 1))
 
 
 def msd_sort(string_array):
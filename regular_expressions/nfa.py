@@ -1,5 +1,61 @@
+from functools import lru_cache
 from utils.digraph import Digraph
-from utils.dfs import DirectedDFS
+
+
+@lru_cache(maxsize=128)
+def epsilon_transitions(regexp):
+    """
+    Finds the ε-transition edges of the NFA of a regular expression.
+    The edges only depend on the regular expression, so they are cached for the regular expressions used most recently,
+    and building an NFA again for one of them skips parsing it.
+
+    Args:
+        regexp (str): The regular expression.
+
+    Returns:
+        tuple: The ε-transition edges, as (vertex_v, vertex_w) pairs.
+    """
+    length_regexp = len(regexp)
+    edges = []  # ε-transition edges found so far
+    operators = []  # Stack to keep track of the operators '(', ')' and '|'
+
+    for i in range(length_regexp):
+
+        # We found '(' or '|', add the index 'i' to the stack 'operators'
+        left_parentheses = i
+        if regexp[i] == '(' or regexp[i] == '|':
+            operators.append(i)
+
+        # We found a closing parenthesis ')'
+        elif regexp[i] == ')':
+            or_index = operators.pop()
+
+            # We are closing parentheses which includes '|'
+            if regexp[or_index] == '|':
+
+                # Update 'left_parentheses' if '|' was found
+                left_parentheses = operators.pop()
+
+                # Add two ε-transition edges for each '|' operator.
+                edges.append((left_parentheses, or_index + 1))
+                edges.append((or_index, i))
+
+            # No '|' found, it corresponds to a '('
+            else:
+                left_parentheses = or_index
+
+        # Closure needs 1-character lookahead, so we we just go to length_regexp-1
+        if i < length_regexp - 1 and regexp[i + 1] == '*':
+
+            # Add two ε-transition edges for each '*' operator
+            edges.append((left_parentheses, i + 1))
+            edges.append((i + 1, left_parentheses))
+
+        # Add ε-transition edges for '(', '*', and ')'
+        if regexp[i] == '(' or regexp[i] == '*' or regexp[i] == ')':
+            edges.append((i, i + 1))
+
+    return tuple(edges)
 
 
 class NFA:
@@ -10,6 +66,9 @@ class NFA:
         regexp (str): The regular expression.
         length_regexp (int): The length of the regular expression.
         graph (Digraph): The digraph representing the NFA.
+        closures (list): The bitmask of the states reachable from each state through ε-transitions.
+        matches (dict): The bitmask of the states that read each character of the regular expression.
+        transitions (dict): The transitions of the equivalent DFA computed so far.
     """
 
     def __init__(self, regexp):
@@ -22,6 +81,9 @@ class NFA:
         self.regexp = regexp
         self.length_regexp = len(regexp)
         self.graph = self.build_digraph()
+        self.closures = self.build_closures()
+        self.matches = self.build_matches()
+        self.transitions = {}  # (program_counter, char) -> program_counter after scanning past char
 
     def recognizes(self, text):
         """
@@ -34,52 +96,53 @@ class NFA:
             bool: True if the NFA recognizes the text, False otherwise.
         """
 
-        # program_counter: Set of all possible states that the NFA could be in given the current state
-        program_counter = set()
-
-        # Build DFS with source = 'state 0'
-        dfs = DirectedDFS(self.graph, 0)
-
-        for vertex in range(self.graph.number_of_vertices):
-
-            # We put in program_counter all the states reachable from 'state 0'
-            if dfs.has_path_to(vertex):
-                program_counter.add(vertex)
+        # program_counter: Bitmask of all possible states that the NFA could be in given the current state,
+        # bit 'v' is set when the NFA could be in state 'v'.
+        # We put in program_counter all the states reachable from 'state 0'
+        program_counter = self.closures[0]
 
         # Iterate over the string "text"
         for char in text:
 
-            # Set of states reachable after scanning past char
-            states = set()
+            # Each set of states is a state of the equivalent DFA.
+            # Its transitions are computed the first time they are taken and then looked up.
+            transition = (program_counter, char)
+            if transition not in self.transitions:
+                self.transitions[transition] = self._step(program_counter, char)
+            program_counter = self.transitions[transition]
 
-            # Iterate over the current reachable states
-            for vertex in program_counter:
+            # No state is left, the rest of the text cannot be matched
+            if program_counter == 0:
+                return False
 
-                # Not necessarily a match (regexp needs to match full text).
-                # However, the input text may still have more characters to process, then we just move to the next steps.
-                if vertex == self.length_regexp:
-                    continue
+        # Check if we have reached the accept state
+        return program_counter >> self.length_regexp & 1 == 1
 
-                # We have a match between text and regex
-                if self.regexp[vertex] == char or self.regexp[vertex] == '.':
+    def _step(self, program_counter, char):
+        """
+        Computes the states that the NFA could be in after scanning past a character.
+
+        Args:
+            program_counter (int): Bitmask of the states that the NFA could be in before the character.
+            char (str): The character of the text.
 
-                    # Include the next state in the set to consider in the next iteration
-                    states.add(vertex + 1)
+        Returns:
+            int: Bitmask of the states that the NFA could be in after the character.
+        """
 
-            # Builds DFS using a set of sources
-            dfs = DirectedDFS(self.graph, states)
-            program_counter = set()
+        # We have a match between text and regex in the states that read char or '.'.
+        # The accept state reads no character, so it is never included.
+        # Shifting the matches by one bit moves each of them to the next state.
+        states = (program_counter & (self.matches.get(char, 0) | self.matches.get('.', 0))) << 1
 
-            # We put in program_counter all the states reachable from 'states'
-            for vertex in range(self.graph.number_of_vertices):
-                if dfs.has_path_to(vertex):
-                    program_counter.add(vertex)
+        # We put in program_counter all the states reachable from 'states'
+        program_counter = 0
+        while states:
+            lowest = states & -states
+            program_counter |= self.closures[lowest.bit_length() - 1]
+            states ^= lowest
 
-        # Check if we have reached the accept state
-        for vertex in program_counter:
-            if vertex == self.length_regexp:
-                return True
-        return False
+        return program_counter
 
 
     def build_digraph(self):
@@ -90,45 +153,107 @@ class NFA:
             Digraph: The digraph representing the NFA.
         """
         graph = Digraph(self.length_regexp + 1)  # M + 1 to have an extra node for accept state
-        operators = []  # Stack to keep track of the operators '(', ')' and '|'
-
-        for i in range(self.length_regexp):
-
-            # We found '(' or '|', add the index 'i' to the stack 'operators'
-            left_parentheses = i
-            if self.regexp[i] == '(' or self.regexp[i] == '|':
-                operators.append(i)
 
-            # We found a closing parenthesis ')'
-            elif self.regexp[i] == ')':
-                or_index = operators.pop()
+        for vertex_v, vertex_w in epsilon_transitions(self.regexp):
+            graph.add_edge(vertex_v, vertex_w)
 
-                # We are closing parentheses which includes '|'
-                if self.regexp[or_index] == '|':
+        return graph
 
-                    # Update 'left_parentheses' if '|' was found
-                    left_parentheses = operators.pop()
+    def build_closures(self):
+        """
+        Computes the ε-closure of every state of the NFA.
+        The ε-transition digraph does not depend on the text, so the closures are computed once
+        instead of running a DFS from the current states for every character of the text.
 
-                    # Add two ε-transition edges for each '|' operator.
-                    graph.add_edge(left_parentheses, or_index + 1)
-                    graph.add_edge(or_index, i)
+        The strongly connected components of the digraph are found with Tarjan's algorithm, using
+        an explicit stack. It completes each component after every component reachable from it, so
+        the closure of a component is its own states joined with the closures its edges lead to.
 
-                # No '|' found, it corresponds to a '('
+        Returns:
+            list: For each state, a bitmask with the bits of the states reachable from it through ε-transitions.
+        """
+        number_of_vertices = self.graph.number_of_vertices
+        adjacency_lists = self.graph.adjacency_lists
+
+        closures = [0] * number_of_vertices
+        order = [None] * number_of_vertices  # Order in which the DFS reaches each vertex
+        low = [0] * number_of_vertices  # Lowest order reachable from the vertex within its component
+        on_stack = [False] * number_of_vertices
+        component_stack = []  # Vertices whose component is not complete yet
+        count = 0
+
+        for root in range(number_of_vertices):
+            if order[root] is not None:
+                continue
+
+            order[root] = low[root] = count
+            count += 1
+            component_stack.append(root)
+            on_stack[root] = True
+
+            # DFS stack of the vertices being visited and the iterators over their adjacent vertices
+            path = [(root, iter(adjacency_lists[root]))]
+
+            while path:
+                vertex, adjacents = path[-1]
+
+                for adjacent in adjacents:
+                    # Visit the adjacent vertex before going on with the rest
+                    if order[adjacent] is None:
+                        order[adjacent] = low[adjacent] = count
+                        count += 1
+                        component_stack.append(adjacent)
+                        on_stack[adjacent] = True
+                        path.append((adjacent, iter(adjacency_lists[adjacent])))
+                        break
+
+                    # The adjacent vertex is in the component being built
+                    if on_stack[adjacent]:
+                        low[vertex] = min(low[vertex], order[adjacent])
+
+                # All the adjacent vertices have been visited
                 else:
-                    left_parentheses = or_index
-
-            # Closure needs 1-character lookahead, so we we just go to length_regexp-1
-            if i < self.length_regexp - 1 and self.regexp[i + 1] == '*':
+                    path.pop()
+                    if path:
+                        parent = path[-1][0]
+                        low[parent] = min(low[parent], low[vertex])
+
+                    # The vertex is the first one reached in its component, pop the whole component
+                    if low[vertex] == order[vertex]:
+                        component = []
+                        while True:
+                            member = component_stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == vertex:
+                                break
+
+                        # Join the states of the component and the closures of the components it leads to.
+                        # The closures of its own states are still 0, so they add nothing.
+                        closure = 0
+                        for member in component:
+                            closure |= 1 << member
+                            for adjacent in adjacency_lists[member]:
+                                closure |= closures[adjacent]
+
+                        for member in component:
+                            closures[member] = closure
+
+        return closures
+
+    def build_matches(self):
+        """
+        Computes, for each character of the regular expression, the states that read it.
 
-                # Add two ε-transition edges for each '*' operator
-                graph.add_edge(left_parentheses, i + 1)
-                graph.add_edge(i + 1, left_parentheses)
+        Returns:
+            dict: For each character, a bitmask with the bits of the states whose character it is.
+        """
+        matches = {}
 
-            # Add ε-transition edges for '(', '*', and ')'
-            if self.regexp[i] == '(' or self.regexp[i] == '*' or self.regexp[i] == ')':
-                graph.add_edge(i, i + 1)
+        for vertex, char in enumerate(self.regexp):
+            matches[char] = matches.get(char, 0) | (1 << vertex)
 
-        return graph
+        return matches
 
 
 def main():
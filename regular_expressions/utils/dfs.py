@@ -25,18 +25,28 @@ class DirectedDFS:
 
     def _dfs(self, graph, vertex):
         """
-        Recursively performs DFS starting from the given vertex.
+        Performs DFS starting from the given vertex, with an explicit stack instead of recursion.
         
         Args:
             graph (Digraph): The directed graph to perform DFS on.
-            vertex (int): The current vertex being visited.
+            vertex (int): The vertex where the DFS starts.
         """
 
-        self.marked[vertex] = True
-        for adjacent in graph.adjacency_lists[vertex]:
-            if not self.marked[adjacent]:
-                self._dfs(graph, adjacent)
-                self.edge_to[adjacent] = vertex
+        stack = [vertex]
+
+        while stack:
+            vertex = stack.pop()
+
+            # The vertex was pushed more than once and has been visited already
+            if self.marked[vertex]:
+                continue
+
+            self.marked[vertex] = True
+            for adjacent in graph.adjacency_lists[vertex]:
+                if not self.marked[adjacent]:
+                    # The last vertex pushing 'adjacent' is the one it is visited from
+                    self.edge_to[adjacent] = vertex
+                    stack.append(adjacent)
 
     def has_path_to(self, vertex):
         """
@@ -16,7 +16,8 @@ class Digraph:
         """
 
         self.number_of_vertices = number_of_vertices
-        self.adjacency_lists = {vertex: set() for vertex in range(self.number_of_vertices)}
+        # The vertices are the integers 0 to V - 1, so the adjacency sets are indexed by vertex in a list
+        self.adjacency_lists = [set() for _ in range(self.number_of_vertices)]
 
     @property
     def number_of_edges(self):
@@ -27,7 +28,7 @@ class Digraph:
             int: The total number of edges.
         """
 
-        return sum([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()])
+        return sum([len(adjacency_list) for adjacency_list in self.adjacency_lists])
 
     def add_edge(self, vertex_v, vertex_w):
         """
@@ -85,7 +86,7 @@ class Digraph:
             int: The maximum out-degree.
         """
 
-        return max([len(adjacency_list) for adjacency_list in self.adjacency_lists.values()])
+        return max([len(adjacency_list) for adjacency_list in self.adjacency_lists])
 
     def average_degree(self):
         """
@@ -106,8 +107,8 @@ class Digraph:
         """
 
         count = 0
-        for vertex_v in self.adjacency_lists.keys():
-            for vertex_w in self.adjacency_lists[vertex_v]:
+        for vertex_v, adjacency_list in enumerate(self.adjacency_lists):
+            for vertex_w in adjacency_list:
                 if vertex_v == vertex_w:
                     count += 1
         return count
@@ -151,7 +152,7 @@ class Digraph:
 
         reversed_graph = cls(graph.number_of_vertices)
 
-        for vertex_v, set_vertices_w in graph.adjacency_lists.items():
+        for vertex_v, set_vertices_w in enumerate(graph.adjacency_lists):
             for vertex_w in set_vertices_w:
                 reversed_graph.add_edge(vertex_w, vertex_v)
 
@@ -1,57 +1,83 @@
+import mmap
+import os
+from functools import lru_cache
+
+
+@lru_cache(maxsize=128)
 def boyer_moore(pattern):
     """
     Preprocesses the pattern to create the 'right' array for the Boyer-Moore algorithm.
+    The arrays of the patterns searched most recently are cached, so searching again for one of them reuses it.
     
     Args:
-        pattern (str): The pattern to be searched.
+        pattern (bytes): The pattern to be searched.
     
     Returns:
-        list: An array indicating the last occurrence of each character in the pattern.
+        tuple: An array indicating the last occurrence of each byte in the pattern.
+        It is shared between calls with the same pattern, so it is returned as an immutable tuple.
     """
-    R = 256  # ASCII characters
+    R = 256  # Extended ASCII, one entry per byte value
     right = [-1] * R
 
-    # Populate the 'right' array with the last occurrence of each character in the pattern
-    for j, char in enumerate(pattern):
-        right[ord(char)] = j
+    # Populate the 'right' array with the last occurrence of each byte in the pattern.
+    # Iterating over bytes yields their integer values, which index the array directly.
+    for j, byte in enumerate(pattern):
+        right[byte] = j
 
-    return right
+    return tuple(right)
 
 
 def search(txt_file, pattern):
     """
     Searches for the pattern in the given text file using the Boyer-Moore algorithm and prints the starting indices of matches.
+    The file is read as bytes, so the indices are byte offsets.
     
     Args:
         txt_file (str): The path to the text file to search.
         pattern (str): The pattern to search for.
     """
+    # Compare bytes with bytes, indexing them returns integers instead of new one-character strings
+    pattern = pattern.encode()
     length_pattern = len(pattern)
     right = boyer_moore(pattern)  # Preprocess the pattern
 
-    with open(txt_file, 'r') as file:
-        content = file.read()
-        length_content = len(content)
+    with open(txt_file, 'rb') as file:
+        # An empty file cannot be mapped, and holds no match
+        if os.fstat(file.fileno()).st_size == 0:
+            return
 
-        i = 0
+        # Map the file into memory instead of reading a copy of it.
+        # The mapping is indexed like bytes, reading the pages of the file as they are needed.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            length_content = len(content)
 
-        # Iterate over the text content
-        while i <= length_content - length_pattern:
-            skip = 0
+            last = pattern[length_pattern - 1:]  # As a one-byte string, to search for it with find
+            i = 0
 
-            # Compare the pattern with the text from right to left
-            for j in range(length_pattern - 1, -1, -1):
-                if pattern[j] != content[i + j]:
-                    # Calculate the skip value based on the mismatch
-                    skip = max(1, j - right[ord(content[i + j])])
+            # Iterate over the text content
+            while i <= length_content - length_pattern:
+                # Skip loop: move to the next alignment where the last byte of the pattern matches the text.
+                # The alignments in between mismatch on their last byte, find passes over them in C.
+                end = content.find(last, i + length_pattern - 1)
+                if end == -1:
                     break
+                i = end - length_pattern + 1
+
+                skip = 0
+
+                # Compare the rest of the pattern with the text from right to left
+                for j in range(length_pattern - 2, -1, -1):
+                    if pattern[j] != content[i + j]:
+                        # Calculate the skip value based on the mismatch
+                        skip = max(1, j - right[content[i + j]])
+                        break
 
-            # If no mismatch, pattern is found
-            if skip == 0:
-                print("Pattern found at index:", i)  # Print the starting index of the match
-                i += length_pattern  # Move to the next position after the pattern
+                # If no mismatch, pattern is found
+                if skip == 0:
+                    print("Pattern found at index:", i)  # Print the starting index of the match
+                    i += length_pattern  # Move to the next position after the pattern
 
-            i += skip  # Move to the next position based on the skip value
+                i += skip  # Move to the next position based on the skip value
 
 
 def main():
@@ -1,37 +1,42 @@
+import mmap
+import os
+
+
 def KMP(pattern):
     """
     Builds the deterministic finite automaton (DFA) for a given pattern.
 
+    The DFA is stored with one row per state, holding the next state for each byte.
+    Each row starts as a copy of the row of the restart state, a single list copy.
+
     Args:
-        pattern (str): The pattern to search for.
+        pattern (bytes): The pattern to search for.
 
     Returns:
-        list: A 2D list representing the DFA.
+        list: A 2D list representing the DFA, indexed by state and then by byte.
     """
-    R = 256  # ASCII characters
+    R = 256  # Extended ASCII, one entry per byte value
     pattern_length = len(pattern)
-    dfa = [[0] * pattern_length for _ in range(R)]
+    dfa = [None] * pattern_length
 
     # Define dfa for state = 0:
-    # Assign 1 for matching the first character in the pattern.
-    # Assign 0 for the other characters.
+    # Assign 1 for matching the first byte in the pattern.
+    # Assign 0 for the other bytes.
     restart_state = 0
-    dfa[ord(pattern[0])][restart_state] = 1
+    dfa[0] = [0] * R
+    dfa[0][pattern[0]] = 1
 
     # Iterate over the pattern
     for j in range(1, pattern_length):
 
-        # Iterate over all the possible characters
-        for char in range(R):
-
-            # Copy mismatch cases from restart state
-            dfa[char][j] = dfa[char][restart_state]
+        # Copy mismatch cases from restart state
+        dfa[j] = dfa[restart_state][:]
 
         # Set match case
-        dfa[ord(pattern[j])][j] = j + 1
+        dfa[j][pattern[j]] = j + 1
 
         # Update restart state. This will depend on the pattern
-        restart_state = dfa[ord(pattern[j])][restart_state]
+        restart_state = dfa[restart_state][pattern[j]]
 
     return dfa
 
@@ -39,25 +44,44 @@ def KMP(pattern):
 def search(txt_file, pattern):
     """
     Searches for a pattern in a text file and prints the positions of matches.
+    The file is read as bytes, so the positions are byte offsets.
 
     Args:
         txt_file (str): The path to the text file to search.
         pattern (str): The pattern to search for.
     """
+    # Iterating over bytes yields their integer values, which index the DFA directly
+    pattern = pattern.encode()
     length_pattern = len(pattern)
     dfa = KMP(pattern)
 
-    with open(txt_file, 'r') as file:
-        content = file.read()
-        length_content = len(content)
-        state = 0
-
-        for index, char in enumerate(content):
-            state = dfa[ord(char)][state]
-
-            if state == length_pattern:
-                print("Pattern found at index:", index - length_pattern + 1)
-                state = 0
+    with open(txt_file, 'rb') as file:
+        # An empty file cannot be mapped, and holds no match
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        # Map the file into memory instead of reading a copy of it.
+        # The mapping is indexed like bytes, reading the pages of the file as they are needed.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            length_content = len(content)
+            first = pattern[:1]  # As a one-byte string, to search for it with find
+            state = 0
+            index = 0
+
+            while index < length_content:
+                # The DFA only leaves state 0 on the first byte of the pattern,
+                # find jumps to its next occurrence in C instead of stepping through every byte
+                if state == 0:
+                    index = content.find(first, index)
+                    if index == -1:
+                        break
+
+                state = dfa[state][content[index]]
+                index += 1
+
+                if state == length_pattern:
+                    print("Pattern found at index:", index - length_pattern)
+                    state = 0
 
 
 def main():
@@ -1,5 +1,9 @@
-R = 256  # ASCII characters
-Q = 997  # Modulus
+import mmap
+import os
+
+
+R = 256  # Extended ASCII, one value per byte
+Q = 4194301  # Modulus, a prime below 2^22 so that Q * R stays within a single 30-bit digit of a Python int
 
 
 def get_hash(key, length):
@@ -7,21 +11,22 @@ def get_hash(key, length):
     Computes the hash value for a given key using the specified length.
 
     Args:
-        key (str): The string for which the hash value is computed.
-        length (int): The length of the substring to hash.
+        key (bytes): The bytes for which the hash value is computed.
+        length (int): The length of the prefix to hash.
 
     Returns:
-        int: The hash value of the substring.
+        int: The hash value of the prefix.
     """
     h = 0
     for j in range(length):
-        h = (R * h + ord(key[j])) % Q
+        h = (R * h + key[j]) % Q
     return h
 
 
 def search(txt_file, pattern):
     """
     Searches for a pattern in a text file using the Rabin-Karp algorithm.
+    The file is read as bytes, so the indices are byte offsets.
 
     Args:
         txt_file (str): The path to the text file to search.
@@ -30,6 +35,8 @@ def search(txt_file, pattern):
     Returns:
         None
     """
+    # Indexing bytes returns their integer values, no ord call is needed
+    pattern = pattern.encode()
     length_pattern = len(pattern)
     hash_pattern = get_hash(pattern, len(pattern))
 
@@ -38,25 +45,40 @@ def search(txt_file, pattern):
     for _ in range(length_pattern - 1):
         RM = (R * RM) % Q
 
-    with open(txt_file, 'r') as file:
-        content = file.read()
-        length_content = len(content)
-        txt_hash = get_hash(content, len(pattern))
-
-        # Check the hash of the first window
-        if txt_hash == hash_pattern:
-            print("Pattern found at index:", 0)
-        
-        # Slide the pattern over text
-        for i in range(length_pattern, length_content):
-            # Remove the influence of the outgoing character (the character at i - M)
-            txt_hash = (txt_hash + Q - RM * ord(content[i - length_pattern]) % Q) % Q
-
-            # Add the influence of the incoming character (the character at i)
-            txt_hash = (txt_hash * R + ord(content[i])) % Q
-
-            if txt_hash == hash_pattern:
-                print("Pattern found at index:", i - length_pattern + 1)
+    # Precompute the influence of each byte value when it is the outgoing character
+    outgoing_hash = [RM * byte % Q for byte in range(R)]
+
+    with open(txt_file, 'rb') as file:
+        # An empty file cannot be mapped, and holds no match
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+
+        # Map the file into memory instead of reading a copy of it.
+        # The mapping is indexed like bytes, reading the pages of the file as they are needed.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            # The text is shorter than the pattern
+            if len(content) < length_pattern:
+                return
+
+            txt_hash = get_hash(content, len(pattern))
+
+            # Check the hash of the first window, and the window itself to rule out a hash collision
+            if txt_hash == hash_pattern and content[:length_pattern] == pattern:
+                print("Pattern found at index:", 0)
+
+            # Iterating over a mapping yields one-byte strings, iterating over a memoryview of it yields integers.
+            # The memoryviews are slices of the mapping, not copies, and are released before it is closed.
+            with memoryview(content) as outgoing_view, outgoing_view[length_pattern:] as incoming_view:
+
+                # Slide the pattern over text, pairing the outgoing character (at i - M) with the incoming one (at i)
+                for i, (outgoing, incoming) in enumerate(zip(outgoing_view, incoming_view), length_pattern):
+                    # Remove the influence of the outgoing character and add the influence of the incoming character.
+                    # Python's modulo is never negative, so a single reduction is enough.
+                    txt_hash = ((txt_hash - outgoing_hash[outgoing]) * R + incoming) % Q
+
+                    # Equal hashes are checked against the pattern, a collision is not reported as a match
+                    if txt_hash == hash_pattern and content[i - length_pattern + 1:i + 1] == pattern:
+                        print("Pattern found at index:", i - length_pattern + 1)
 
 
 def main():
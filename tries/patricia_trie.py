@@ -0,0 +1,338 @@
+class PatriciaTrieST:
+    """
+    A Patricia Trie (radix tree) data structure implementation.
+    The chains of nodes with a single child and no value are collapsed into one node,
+    so each node is reached through an edge labeled with a whole string instead of a single character.
+    """
+
+    class Node:
+        """
+        A node in the Patricia Trie.
+        """
+        __slots__ = ('value', 'label', 'next')  # Fixed attributes, no per-node __dict__
+
+        def __init__(self, label=""):
+            """
+            Initializes a node with a value, the label of its incoming edge and a dictionary of children.
+
+            Args:
+                label (str): The label of the edge leading to the node.
+            """
+            self.value = None
+            self.label = label
+            self.next = {}  # Children keyed by the first character of their label
+
+    def __init__(self):
+        """Initializes the root node and the size of the trie."""
+        self.root = PatriciaTrieST.Node()
+        self.size = 0
+
+    def put(self, key, value):
+        """
+        Inserts a key-value pair into the trie.
+
+        Args:
+            key (str): The key to insert.
+            value: The value associated with the key.
+        """
+        node = self.root
+        depth = 0
+        key_length = len(key)
+
+        while depth < key_length:
+            char = key[depth]
+            node_next = node.next.get(char)
+
+            # No edge starts with the next character, the rest of the key becomes a new edge
+            if node_next is None:
+                node_next = node.next[char] = PatriciaTrieST.Node(key[depth:])
+                node = node_next
+                break
+
+            # Length of the common prefix of the edge label and the rest of the key
+            label = node_next.label
+            common = 1
+            limit = min(len(label), key_length - depth)
+            while common < limit and label[common] == key[depth + common]:
+                common += 1
+
+            # The key leaves the edge before its end, split the edge at the mismatch
+            if common < len(label):
+                middle = PatriciaTrieST.Node(label[:common])
+                node_next.label = label[common:]
+                middle.next[node_next.label[0]] = node_next
+                node.next[char] = node_next = middle
+
+            node = node_next
+            depth += common
+
+        if node.value is None:
+            self.size += 1
+        node.value = value
+
+    def contains(self, key):
+        """
+        Checks if a key is in the trie.
+
+        Args:
+            key (str): The key to check.
+
+        Returns:
+            bool: True if the key is in the trie, False otherwise.
+        """
+        return self.get(key) is not None
+
+    def get(self, key):
+        """
+        Retrieves the value associated with the given key.
+
+        Args:
+            key (str): The key to retrieve.
+
+        Returns:
+            The value associated with the key, or None if the key is not found.
+        """
+        node = self.root
+        depth = 0
+        key_length = len(key)
+
+        while depth < key_length:
+            node = node.next.get(key[depth])
+
+            # The key must follow the whole edge label
+            if node is None or not key.startswith(node.label, depth):
+                return None
+
+            depth += len(node.label)
+
+        return node.value
+
+    def delete(self, key):
+        """
+        Deletes a key from the trie.
+
+        Args:
+            key (str): The key to delete.
+        """
+        # Walk down the key, recording the parent of each node on the path
+        node = self.root
+        path = []
+        depth = 0
+        key_length = len(key)
+
+        while depth < key_length:
+            char = key[depth]
+            path.append((node, char))
+            node = node.next.get(char)
+
+            # The key does not exist in the trie
+            if node is None or not key.startswith(node.label, depth):
+                return
+
+            depth += len(node.label)
+
+        # The key does not exist in the trie
+        if node.value is None:
+            return
+
+        self.size -= 1
+        node.value = None
+
+        # Cleanup
+
+        # A node with no value and no children is removed from its parent,
+        # which may in turn be left with no value and a single child
+        if not node.next and path:
+            parent, char = path.pop()
+            del parent.next[char]
+            node = parent
+
+        # A node with no value and a single child is merged with it. The root is never merged.
+        if node is not self.root and node.value is None and len(node.next) == 1:
+            (child,) = node.next.values()
+            node.label += child.label
+            node.value = child.value
+            node.next = child.next
+
+    def __bool__(self):
+        """
+        Checks if the trie is empty.
+
+        Returns:
+            bool: True if the trie is not empty, False otherwise.
+        """
+        return self.root.value is not None or bool(self.root.next)
+
+    def keys(self):
+        """
+        Returns all keys in the trie.
+
+        Returns:
+            list: A list of all keys in the trie.
+        """
+        return self.keys_with_prefix("")
+
+    def keys_with_prefix(self, prefix):
+        """
+        Returns all keys in the trie that start with the given prefix.
+
+        Args:
+            prefix (str): The prefix to search for.
+
+        Returns:
+            list: A list of keys that start with the given prefix.
+        """
+        node = self.root
+        path = ""
+        depth = 0
+        prefix_length = len(prefix)
+
+        # Walk down the prefix, which may end in the middle of an edge label
+        while depth < prefix_length:
+            node = node.next.get(prefix[depth])
+
+            # No key starts with the prefix
+            if node is None or not node.label.startswith(prefix[depth:depth + len(node.label)]):
+                return []
+
+            path += node.label
+            depth += len(node.label)
+
+        return list(self._collect(node, path))
+
+    def _collect(self, node, prefix):
+        """
+        Helper generator to yield all keys in the trie with the given prefix, in order.
+        The trie is traversed with an explicit stack, so deep keys do not hit the recursion limit.
+
+        Args:
+            node (PatriciaTrieST.Node): The node where the traversal starts.
+            prefix (str): The string spelled by the edge labels down to the node.
+
+        Yields:
+            str: The keys found below the node, in sorted order.
+        """
+        stack = [(node, prefix)]
+
+        while stack:
+            node, prefix = stack.pop()
+
+            # The node contains a value, yield its key
+            if node.value is not None:
+                yield prefix
+
+            # The labels of the children start with distinct characters, so sorting them by their first character
+            # keeps the keys in order. They are pushed in reverse order, to be popped in that order.
+            for char in sorted(node.next, reverse=True):
+                node_next = node.next[char]
+                stack.append((node_next, prefix + node_next.label))
+
+    def keys_that_match(self, pattern):
+        """
+        Retrieves all keys that match the specified pattern.
+        The keys returned will have the same length as the given pattern.
+
+        Args:
+            pattern (str): The pattern to match, where "." serves as a wildcard that can match any character.
+
+        Returns:
+            list: A list of keys that match the specified pattern.
+        """
+        return list(self._collect2(self.root, "", pattern))
+
+    def _collect2(self, node, prefix, pattern):
+        """
+        Helper generator to yield all keys that match the given pattern, in order.
+        The trie is traversed with an explicit stack, so long patterns do not hit the recursion limit.
+
+        Args:
+            node (PatriciaTrieST.Node): The node where the traversal starts.
+            prefix (str): The string spelled by the edge labels down to the node.
+            pattern (str): The pattern to match.
+
+        Yields:
+            str: The matching keys found below the node, in sorted order.
+        """
+        pattern_length = len(pattern)
+        stack = [(node, prefix)]
+
+        while stack:
+            node, prefix = stack.pop()
+
+            # We have reached the end of the pattern
+            depth = len(prefix)
+            if depth == pattern_length:
+                if node.value is not None:
+                    yield prefix
+                continue
+
+            # The wildcard matches every child, otherwise only the child of the pattern character can match.
+            # The children are pushed in reverse order, so they are popped in the order of their characters.
+            next_char = pattern[depth]
+            if next_char == '.':
+                chars = sorted(node.next, reverse=True)
+            else:
+                chars = [next_char] if next_char in node.next else []
+
+            # Push the children whose whole label matches the pattern
+            for char in chars:
+                node_next = node.next[char]
+                label = node_next.label
+                end = depth + len(label)
+
+                if end <= pattern_length and all(p == '.' or p == c for p, c in zip(pattern[depth:end], label)):
+                    stack.append((node_next, prefix + label))
+
+    def longest_prefix_of(self, string):
+        """
+        Returns the longest prefix of the given string that exists in the trie.
+
+        Args:
+            string (str): The input string to search for the longest prefix.
+
+        Returns:
+            str: The longest prefix of the input string that exists in the trie.
+        """
+        node = self.root
+        depth = 0
+        length = 0
+        string_length = len(string)
+
+        while True:
+            if node.value is not None:
+                length = depth  # Updates length
+
+            if depth == string_length:
+                break
+
+            # The string must follow the whole edge label
+            node = node.next.get(string[depth])
+            if node is None or not string.startswith(node.label, depth):
+                break
+
+            depth += len(node.label)
+
+        return string[:length]
+
+
+def main():
+    """Main function to demonstrate the usage of the PatriciaTrieST class."""
+
+    # Initialize the trie
+    trie = PatriciaTrieST()
+
+    # Add keys and values to the trie
+    trie.put("cat", "animal")
+    trie.put("car", "vehicle")
+    trie.put("cart", "item")
+    trie.put("dog", "animal")
+
+    # Check methods
+    print("All keys:", trie.keys())  # Output: ['car', 'cart', 'cat', 'dog']
+    print("Keys with prefix 'car':", trie.keys_with_prefix("car"))  # Output: ['car', 'cart']
+    print("Keys that match pattern '.a.':", trie.keys_that_match(".a."))  # Output: ['car', 'cat']
+    print("Longest prefix of 'cartoon':", trie.longest_prefix_of("cartoon"))  # Output: cart
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
 class TrieST:
     """
-    A Trie (Prefix Tree) data structure implementation for extended ASCII.
+    A Trie (Prefix Tree) data structure implementation.
+    Each node only stores its existing children, so the trie is not limited to extended ASCII.
     """
-    R = 256  # For extended ASCII
 
     class Node:
         """
         A node in the Trie.
         """
+        __slots__ = ('value', 'next')  # Fixed attributes, no per-node __dict__
+
         def __init__(self):
-            """Initializes a node with a value and an array of children."""
+            """Initializes a node with a value and a dictionary of children keyed by their character."""
             self.value = None
-            self.next = [None] * TrieST.R
+            self.next = {}
 
     def __init__(self):
         """Initializes the root node and the size of the trie."""
@@ -26,33 +28,32 @@ class TrieST:
             key (str): The key to insert.
             value: The value associated with the key.
         """
-        if not self.contains(key):
-            self.size += 1
-        self.root = self._put(self.root, key, value, 0)
+        self._put(key, value)
 
-    def _put(self, node, key, value, depth):
+    def _put(self, key, value):
         """
         Helper method to insert a key-value pair into the trie.
+        Walks down the key, creating the missing nodes along the way.
+        The size is updated in the same walk, when the key had no value yet.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
             key (str): The key to insert.
             value: The value associated with the key.
-            depth (int): The current depth in the trie.
-
-        Returns:
-            TrieST.Node: The updated node.
         """
-        if node is None:
-            node = TrieST.Node()
+        node = self.root
 
-        if depth == len(key):
-            node.value = value
-            return node
+        for char in key:
+            node_next = node.next.get(char)
 
-        char = ord(key[depth])
-        node.next[char] = self._put(node.next[char], key, value, depth + 1)
-        return node
+            # Create the missing node
+            if node_next is None:
+                node_next = node.next[char] = TrieST.Node()
+
+            node = node_next
+
+        if node.value is None:
+            self.size += 1
+        node.value = value
 
     def contains(self, key):
         """
@@ -76,33 +77,30 @@ class TrieST:
         Returns:
             The value associated with the key, or None if the key is not found.
         """
-        node = self._get(self.root, key, 0)
+        node = self._get(self.root, key)
 
         if node is None:
             return None
 
         return node.value
 
-    def _get(self, node, key, depth):
+    def _get(self, node, key):
         """
         Helper method to retrieve the node associated with the given key.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
+            node (TrieST.Node): The node where the search starts.
             key (str): The key to retrieve.
-            depth (int): The current depth in the trie.
 
         Returns:
             TrieST.Node: The node associated with the key, or None if not found.
         """
-        if node is None:
-            return None
+        for char in key:
+            if node is None:
+                return None
+            node = node.next.get(char)
 
-        if depth == len(key):
-            return node
-
-        char = ord(key[depth])
-        return self._get(node.next[char], key, depth + 1)
+        return node
 
     def delete(self, key):
         """
@@ -111,54 +109,45 @@ class TrieST:
         Args:
             key (str): The key to delete.
         """
-        if self.contains(key):
-            self.size -= 1
-            self.root = self._delete(self.root, key, 0)
+        self._delete(key)
 
-    def _delete(self, node, key, depth):
+    def _delete(self, key):
         """
         Helper method to delete a key from the trie.
+        The nodes left with no value and no children are removed from the bottom up.
+        The size is updated in the same walk, when the key had a value.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
             key (str): The key to delete.
-            depth (int): The current depth in the trie.
-
-        Returns:
-            TrieST.Node: The updated node, or None if the key does not exist.
         """
+        # Walk down the key, recording the parent of each node on the path
+        node = self.root
+        path = []
+        for char in key:
+            path.append((node, char))
+            node = node.next.get(char)
 
-        # The key does not exist in the trie
-        if node is None:
-            return None
+            # The key does not exist in the trie
+            if node is None:
+                return
 
-        # We've reached the node where the value is stored
-        if depth == len(key):
-            # Set the value of this node to None
-            node.value = None
+        # The key does not exist in the trie
+        if node.value is None:
+            return
 
-        # We're not yet at the end of the key, proceed to the next character
-        else:
-            char = ord(key[depth])
-            node.next[char] = self._delete(node.next[char], key, depth + 1)
+        # Set the value of the node of the key to None
+        self.size -= 1
+        node.value = None
 
         # Cleanup
 
-        # If the current node has a non-None value, return the node.
-        # This means there are still other keys stored here or this is the root node.
-
-        if node.value is not None or node == self.root:
-            return node
-
-        # Check if the current node has any non-None children.
-        # If it does, return the node.
-        for node_next in node.next:
-            if node_next is not None:
-                return node
-
-        # If the node has no value and no children,
-        # return None to delete the reference to the node.
-        return None
+        # Remove the nodes with no value and no children, stopping at the first node
+        # that still stores a value or has other children. The root is never removed.
+        for parent, char in reversed(path):
+            if node.value is not None or node.next:
+                break
+            del parent.next[char]
+            node = parent
 
     def __bool__(self):
         """
@@ -167,14 +156,7 @@ class TrieST:
         Returns:
             bool: True if the trie is not empty, False otherwise.
         """
-        if self.root.value is not None:
-            return True
-
-        for node_next in self.root.next:
-            if node_next is not None:
-                return True
-
-        return False
+        return self.root.value is not None or bool(self.root.next)
 
     def keys(self):
         """
@@ -195,32 +177,38 @@ class TrieST:
         Returns:
             list: A list of keys that start with the given prefix.
         """
-        queue = []
-        node_prefix = self._get(self.root, prefix, 0)
-        self._collect(node_prefix, prefix, queue)
-        return queue
+        node_prefix = self._get(self.root, prefix)
 
-    def _collect(self, node, prefix, queue):
+        # The prefix does not exist in the trie
+        if node_prefix is None:
+            return []
+
+        return list(self._collect(node_prefix, prefix))
+
+    def _collect(self, node, prefix):
         """
-        Helper method to collect all keys in the trie with the given prefix.
+        Helper generator to yield all keys in the trie with the given prefix, in order.
+        The trie is traversed with an explicit stack, so deep keys do not hit the recursion limit.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
-            prefix (str): The prefix associated with the current node.
-            queue (list): The queue to collect the keys.
+            node (TrieST.Node): The node where the traversal starts.
+            prefix (str): The prefix associated with the node.
+
+        Yields:
+            str: The keys found below the node, in sorted order.
         """
+        stack = [(node, prefix)]
 
-        # The key does not exist in the trie
-        if node is None:
-            return
+        while stack:
+            node, prefix = stack.pop()
 
-        # The node contains a value, add to the queue
-        if node.value is not None:
-            queue.append(prefix)
+            # The node contains a value, yield its key
+            if node.value is not None:
+                yield prefix
 
-        # Recursively explore the trie
-        for i, node_next in enumerate(node.next):
-            self._collect(node_next, prefix + chr(i), queue)
+            # Push the children in reverse order, so they are popped in the order of their characters
+            for char in sorted(node.next, reverse=True):
+                stack.append((node.next[char], prefix + char))
 
     def keys_that_match(self, pattern):
         """
@@ -233,37 +221,44 @@ class TrieST:
         Returns:
             list: A list of keys that match the specified pattern.
         """
-        queue = []
-        self._collect2(self.root, "", pattern, queue)
-        return queue
+        return list(self._collect2(self.root, "", pattern))
 
-    def _collect2(self, node, prefix, pattern, queue):
+    def _collect2(self, node, prefix, pattern):
         """
-        Helper method to collect all keys that match the given pattern.
+        Helper generator to yield all keys that match the given pattern, in order.
+        The trie is traversed with an explicit stack, so long patterns do not hit the recursion limit.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
-            prefix (str): The prefix associated with the current node.
+            node (TrieST.Node): The node where the traversal starts.
+            prefix (str): The prefix associated with the node.
             pattern (str): The pattern to match.
-            queue (list): The queue to collect the matching keys.
+
+        Yields:
+            str: The matching keys found below the node, in sorted order.
         """
+        pattern_length = len(pattern)
+        stack = [(node, prefix)]
 
-        # (Base case) The key does not exist in the trie
-        if node is None:
-            return
+        while stack:
+            node, prefix = stack.pop()
 
-        # (Base case) We have reached the end of the pattern
-        depth = len(prefix)
-        if depth == len(pattern):
-            if node.value is not None:
-                queue.append(prefix)
-            return
+            # We have reached the end of the pattern
+            depth = len(prefix)
+            if depth == pattern_length:
+                if node.value is not None:
+                    yield prefix
+                continue
+
+            next_char = pattern[depth]
 
-        # Recursive Exploration
-        next_char = pattern[depth]
-        for i, node_next in enumerate(node.next):
-            if next_char == '.' or next_char == chr(i):
-                self._collect2(node_next, prefix + chr(i), pattern, queue)
+            # The wildcard matches every child, pushed in reverse order so they are popped in the order of their characters
+            if next_char == '.':
+                for char in sorted(node.next, reverse=True):
+                    stack.append((node.next[char], prefix + char))
+
+            # Otherwise, only the child of the pattern character matches
+            elif next_char in node.next:
+                stack.append((node.next[next_char], prefix + next_char))
 
     def longest_prefix_of(self, string):
         """
@@ -275,34 +270,35 @@ class TrieST:
         Returns:
             str: The longest prefix of the input string that exists in the trie.
         """
-        length = self._search(self.root, string, 0, 0)
+        length = self._search(string)
         return string[:length]
 
-    def _search(self, node, string, depth, length):
+    def _search(self, string):
         """
         Helper method to find the length of the longest prefix of the given string.
 
         Args:
-            node (TrieST.Node): The current node in the trie.
             string (str): The input string to search for.
-            depth (int): The current depth in the trie.
-            length (int): The length of the current longest prefix found.
 
         Returns:
             int: The length of the longest prefix of the input string that exists in the trie.
         """
+        node = self.root
+        length = 0
 
-        # Base cases
-        if node is None:
-            return length
+        for depth, char in enumerate(string):
+            if node.value is not None:
+                length = depth  # Updates length
+
+            node = node.next.get(char)
+            if node is None:
+                return length
+
+        # The whole string was consumed
         if node.value is not None:
-            length = depth  # Updates length
-        if depth == len(string):
-            return length
+            length = len(string)
 
-        # Recursive Exploration
-        char = ord(string[depth])
-        return self._search(node.next[char], string, depth + 1, length)
+        return length
 
 
 def main():